@@ -7,19 +7,42 @@
     :license: see LICENSE for details.
 """
 import configparser
-import json
+import itertools
 import logging
+import socket
+import threading
 import requests
+from http import cookiejar
 from urllib import parse
+from urllib3.connection import HTTPConnection
 import Exception as ex
+from JsonCodec import dumps as _json_dumps, loads as _json_loads
 log = logging.getLogger(__name__)
 
+# Constant query skeletons for the position endpoints. Shared across calls, so
+# they are only ever copied, never mutated in place.
+_DAYWISE_PARAMS = {'dayOrNet': 'DayWise'}
+_NETWISE_PARAMS = {'dayOrNet': 'NetWise'}
+
+
+class _TCPTunedAdapter(requests.adapters.HTTPAdapter):
+    """HTTPAdapter whose pooled connections keep urllib3's TCP_NODELAY and add SO_KEEPALIVE,
+    so idle keep-alive connections aren't silently dropped between orders."""
+
+    socket_options = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault("socket_options", self.socket_options)
+        super().init_poolmanager(*args, **kwargs)
+
 
 class XTSCommon:
     """
     Base variables class
     """
 
+    __slots__ = ('token', 'userID', 'isInvestorClient')
+
     def __init__(self, token=None, userID=None, isInvestorClient=None):
         """Initialize the common variables."""
         self.token = token
@@ -32,6 +55,12 @@ class XTSConnect(XTSCommon):
     The XTS Connect API wrapper class.
     In production, you may initialise a single instance of this class per `api_key`.
     """
+    # Fixed instance layout: no per-instance __dict__, and the attributes read on every
+    # request resolve through slot descriptors rather than a dict lookup.
+    __slots__ = ('debug', 'apiKey', 'secretKey', 'source', 'disable_ssl', 'root', 'timeout',
+                 '_timeouts', '_urls', '_auth_headers', '_auth_headers_token',
+                 '_sessions', '_session_cycle', 'reqsession')
+
     """Get the configurations from config.ini"""
     cfg = configparser.ConfigParser()
     cfg.read('config.ini')
@@ -41,6 +70,21 @@ class XTSConnect(XTSCommon):
     _default_root_uri = cfg.get('root_url', 'root')
     _default_login_uri = _default_root_uri + "/user/session"
     _default_timeout = 7  # In seconds
+    # Fail fast on an unreachable host rather than holding an order for the full read timeout
+    _default_connect_timeout = 5  # In seconds
+
+    # Default connection pool for the shared requests session.
+    # Sized for concurrent order placement against a single host.
+    _default_pool = {"pool_connections": 10, "pool_maxsize": 20}
+
+    # Independent pooled sessions that requests are spread across, so concurrent
+    # order placement doesn't serialise on one session's pool and cookie locks.
+    _default_session_count = 4
+
+    # Sessions built from `_default_pool` are shared by every client in the process, so
+    # a new client starts with warm connections. Created on first use.
+    _shared_sessions = None
+    _shared_sessions_lock = threading.Lock()
 
     # SSL Flag
     _ssl_flag = cfg.get('SSL', 'disable_ssl')
@@ -161,7 +205,10 @@ class XTSConnect(XTSCommon):
         and responses to stdout.
         - `timeout` is the time (seconds) for which the API client will wait for
         a request to complete before it fails. Defaults to 7 seconds
-        - `pool` is manages request pools. It takes a dict of params accepted by HTTPAdapter
+        - `pool` is manages request pools. It takes a dict of params accepted by HTTPAdapter.
+        Defaults to `_default_pool`; each of the `_default_session_count` sessions gets its own
+        pool, and the sessions and their connections are reused round-robin for every request.
+        Clients using the default pool share one set of sessions process-wide.
         - `disable_ssl` disables the SSL verification while making a request.
         If set requests won't throw SSLError if its set to custom `root` url without SSL.
         """
@@ -172,21 +219,51 @@ class XTSConnect(XTSCommon):
         self.disable_ssl = disable_ssl
         self.root = root or self._default_root_uri
         self.timeout = timeout or self._default_timeout
+        # (connect, read) pair handed to requests on every call
+        self._timeouts = (min(self._default_connect_timeout, self.timeout), self.timeout)
+
+        # Resolve every route against the root once instead of on each request
+        self._urls = {route: parse.urljoin(self.root, uri) for route, uri in self._routes.items()}
+
+        # Request headers for the current session token, built once per login
+        self._auth_headers = {}
+        self._auth_headers_token = None
 
         super().__init__()
 
-        # Create requests session only if pool exists. Reuse session
-        # for every request. Otherwise create session for each request
+        # Always reuse pooled sessions so keep-alive connections survive
+        # between requests instead of opening a new connection per call
         if pool:
-            self.reqsession = requests.Session()
-            reqadapter = requests.adapters.HTTPAdapter(**pool)
-            self.reqsession.mount("https://", reqadapter)
+            self._sessions = [self._new_session(pool) for _ in range(self._default_session_count)]
         else:
-            self.reqsession = requests
+            self._sessions = self._get_shared_sessions()
+        self._session_cycle = itertools.cycle(self._sessions)
+        self.reqsession = self._sessions[0]
 
         # disable requests SSL warning
         requests.packages.urllib3.disable_warnings()
 
+    @classmethod
+    def _new_session(cls, pool):
+        """Create a requests session with its own connection pool."""
+        session = requests.Session()
+        adapter = _TCPTunedAdapter(**(pool or cls._default_pool))
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    @classmethod
+    def _get_shared_sessions(cls):
+        """Return the process-wide default sessions, creating them on first use."""
+        with cls._shared_sessions_lock:
+            if cls._shared_sessions is None:
+                sessions = [cls._new_session(None) for _ in range(cls._default_session_count)]
+                for session in sessions:
+                    # Auth travels in headers; don't let one account's cookies leak to another
+                    session.cookies.set_policy(cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+                cls._shared_sessions = sessions
+            return cls._shared_sessions
+
     def _set_common_variables(self, access_token,userID, isInvestorClient):
         """Set the `access_token` received after a successful authentication."""
         super().__init__(access_token,userID, isInvestorClient)
@@ -271,7 +348,7 @@ class XTSConnect(XTSCommon):
             if not self.isInvestorClient:
                 params['clientID'] = clientID
 
-            response = self._post('order.place', json.dumps(params))
+            response = self._post('order.place', _json_dumps(params))
             return response
         except Exception as e:
             return response['description']
@@ -308,7 +385,7 @@ class XTSConnect(XTSCommon):
             if not self.isInvestorClient:
                 params['clientID'] = clientID
 
-            response = self._put('order.modify', json.dumps(params))
+            response = self._put('order.modify', _json_dumps(params))
             return response
         except Exception as e:
             return response['description']
@@ -348,7 +425,7 @@ class XTSConnect(XTSCommon):
                 "apiOrderSource":apiOrderSource,
                 "orderUniqueIdentifier": orderUniqueIdentifier
             }
-            response = self._post('bracketorder.place', json.dumps(params))
+            response = self._post('bracketorder.place', _json_dumps(params))
             print(response)
             return response
         except Exception as e:
@@ -385,7 +462,7 @@ class XTSConnect(XTSCommon):
             if not self.isInvestorClient:
                 params['clientID'] = clientID
 
-            response = self._put('bracketorder.modify', json.dumps(params))
+            response = self._put('bracketorder.modify', _json_dumps(params))
             return response
         except Exception as e:
             return response['description']
@@ -421,7 +498,7 @@ class XTSConnect(XTSCommon):
                       }
             if not self.isInvestorClient:
                 params['clientID'] = clientID
-            response = self._post('order.place.cover', json.dumps(params))
+            response = self._post('order.place.cover', _json_dumps(params))
             return response
         except Exception as e:
             return response['description']
@@ -434,7 +511,7 @@ class XTSConnect(XTSCommon):
             params = {'appOrderID': appOrderID}
             if not self.isInvestorClient:
                 params['clientID'] = clientID
-            response = self._put('order.exit.cover', json.dumps(params))
+            response = self._put('order.exit.cover', _json_dumps(params))
             return response
         except Exception as e:
             return response['description']
@@ -511,9 +588,7 @@ class XTSConnect(XTSCommon):
     def get_dealerposition_netwise(self, clientID=None):
         """The positions API positions by net. Net is the actual, current net position portfolio."""
         try:
-            params = {'dayOrNet': 'NetWise'}
-            if not self.isInvestorClient:
-                params['clientID'] = clientID
+            params = _NETWISE_PARAMS if self.isInvestorClient else {**_NETWISE_PARAMS, 'clientID': clientID}
             response = self._get('portfolio.dealerpositions', params)
             return response
         except Exception as e:
@@ -525,9 +600,7 @@ class XTSConnect(XTSCommon):
         """The positions API returns positions by day, which is a snapshot of the buying and selling activity for
         that particular day."""
         try:
-            params = {'dayOrNet': 'DayWise'}
-            if not self.isInvestorClient:
-                params['clientID'] = clientID
+            params = _DAYWISE_PARAMS if self.isInvestorClient else {**_DAYWISE_PARAMS, 'clientID': clientID}
 
             response = self._get('portfolio.dealerpositions', params)
             return response
@@ -539,9 +612,7 @@ class XTSConnect(XTSCommon):
         """The positions API returns positions by day, which is a snapshot of the buying and selling activity for
         that particular day."""
         try:
-            params = {'dayOrNet': 'DayWise'}
-            if not self.isInvestorClient:
-                params['clientID'] = clientID
+            params = _DAYWISE_PARAMS if self.isInvestorClient else {**_DAYWISE_PARAMS, 'clientID': clientID}
 
             response = self._get('portfolio.positions', params)
             return response
@@ -551,9 +622,7 @@ class XTSConnect(XTSCommon):
     def get_position_netwise(self, clientID=None):
         """The positions API positions by net. Net is the actual, current net position portfolio."""
         try:
-            params = {'dayOrNet': 'NetWise'}
-            if not self.isInvestorClient:
-                params['clientID'] = clientID
+            params = _NETWISE_PARAMS if self.isInvestorClient else {**_NETWISE_PARAMS, 'clientID': clientID}
             response = self._get('portfolio.positions', params)
             return response
         except Exception as e:
@@ -574,7 +643,7 @@ class XTSConnect(XTSCommon):
             }
             if not self.isInvestorClient:
                 params['clientID'] = clientID
-            response = self._put('portfolio.positions.convert', json.dumps(params))
+            response = self._put('portfolio.positions.convert', _json_dumps(params))
             return response
         except Exception as e:
             return response['description']
@@ -597,7 +666,7 @@ class XTSConnect(XTSCommon):
             params = {"exchangeSegment": exchangeSegment, "exchangeInstrumentID": exchangeInstrumentID}
             if not self.isInvestorClient:
                 params['clientID'] = self.userID
-            response = self._post('order.cancelall', json.dumps(params))
+            response = self._post('order.cancelall', _json_dumps(params))
             return response
         except Exception as e:
             return response['description']    
@@ -618,7 +687,7 @@ class XTSConnect(XTSCommon):
                       }
             if not self.isInvestorClient:
                 params['clientID'] = clientID
-            response = self._put('portfolio.squareoff', json.dumps(params))
+            response = self._put('portfolio.squareoff', _json_dumps(params))
             return response
         except Exception as e:
             return response['description']
@@ -679,7 +748,7 @@ class XTSConnect(XTSCommon):
         try:
 
             params = {'instruments': Instruments, 'xtsMessageCode': xtsMessageCode, 'publishFormat': publishFormat}
-            response = self._post('market.instruments.quotes', json.dumps(params))
+            response = self._post('market.instruments.quotes', _json_dumps(params))
             return response
         except Exception as e:
             return response['description']
@@ -687,7 +756,7 @@ class XTSConnect(XTSCommon):
     def send_subscription(self, Instruments, xtsMessageCode):
         try:
             params = {'instruments': Instruments, 'xtsMessageCode': xtsMessageCode}
-            response = self._post('market.instruments.subscription', json.dumps(params))
+            response = self._post('market.instruments.subscription', _json_dumps(params))
             return response
         except Exception as e:
             return response['description']
@@ -695,7 +764,7 @@ class XTSConnect(XTSCommon):
     def send_unsubscription(self, Instruments, xtsMessageCode):
         try:
             params = {'instruments': Instruments, 'xtsMessageCode': xtsMessageCode}
-            response = self._put('market.instruments.unsubscription', json.dumps(params))
+            response = self._put('market.instruments.unsubscription', _json_dumps(params))
             return response
         except Exception as e:
             return response['description']
@@ -703,7 +772,7 @@ class XTSConnect(XTSCommon):
     def get_master(self, exchangeSegmentList):
         try:
             params = {"exchangeSegmentList": exchangeSegmentList}
-            response = self._post('market.instruments.master', json.dumps(params))
+            response = self._post('market.instruments.master', _json_dumps(params))
             return response
         except Exception as e:
             return response['description']
@@ -782,7 +851,7 @@ class XTSConnect(XTSCommon):
     def search_by_instrumentid(self, Instruments):
         try:
             params = {'source': self.source, 'instruments': Instruments}
-            response = self._post('market.search.instrumentsbyid', json.dumps(params))
+            response = self._post('market.search.instrumentsbyid', _json_dumps(params))
             return response
         except Exception as e:
             return response['description']
@@ -828,32 +897,41 @@ class XTSConnect(XTSCommon):
         params = parameters if parameters else {}
 
         # Form a restful URL
-        uri = self._routes[route].format(params)
-        url = parse.urljoin(self.root, uri)
+        url = self._urls[route]
         headers = {}
 
         if self.token:
-            # set authorization header
-            headers.update({'Content-Type': 'application/json', 'Authorization': self.token})
+            # set authorization header; requests copies it, so the dict is safe to share
+            if self._auth_headers_token != self.token:
+                self._auth_headers = {'Content-Type': 'application/json', 'Authorization': self.token}
+                self._auth_headers_token = self.token
+            headers = self._auth_headers
+
+        # Checked once per call so the DEBUG-off path never touches the payloads
+        debug = self.debug and log.isEnabledFor(logging.DEBUG)
+        if debug:
+            log.debug("Request: %s %s %s", method, url, params)
 
         try:
-            r = self.reqsession.request(method,
-                                        url,
-                                        data=params if method in ["POST", "PUT"] else None,
-                                        params=params if method in ["GET", "DELETE"] else None,
-                                        headers=headers,
-                                        verify=not self.disable_ssl)
+            r = next(self._session_cycle).request(method,
+                                                  url,
+                                                  data=params if method in ["POST", "PUT"] else None,
+                                                  params=params if method in ["GET", "DELETE"] else None,
+                                                  headers=headers,
+                                                  timeout=self._timeouts,
+                                                  verify=not self.disable_ssl)
 
         except Exception as e:
             raise e
 
-        if self.debug:
-            log.debug("Response: {code} {content}".format(code=r.status_code, content=r.content))
+        if debug:
+            log.debug("Response: %s %s", r.status_code, r.content)
 
         # Validate the content type.
         if "json" in r.headers["content-type"]:
             try:
-                data = json.loads(r.content.decode("utf8"))
+                # orjson parses the raw bytes without building a str; json.loads decodes them itself
+                data = _json_loads(r.content)
             except ValueError:
                 raise ex.XTSDataException("Couldn't parse the JSON response received from the server: {content}".format(
                     content=r.content))
@@ -1,8 +1,19 @@
 import configparser
+import functools
 import os
 
 import socketio
 
+from JsonCodec import socketio_json
+
+
+@functools.lru_cache(maxsize=None)
+def _load_config(configFilePath):
+    """Read config.ini, cached per path so reconnects skip the disk read."""
+    configParser = configparser.RawConfigParser()
+    configParser.read(configFilePath)
+    return configParser
+
 
 class OrderSocket_io(socketio.Client):
     """A Socket.IO client.
@@ -41,7 +52,11 @@ class OrderSocket_io(socketio.Client):
     def __init__(self, token, userID, reconnection=True, reconnection_attempts=0, reconnection_delay=1,
                  reconnection_delay_max=50000, randomization_factor=0.5, logger=False, binary=False, json=None,
                  **kwargs):
-        self.sid = socketio.Client(logger=True, engineio_logger=True)
+        if json is None:
+            json = socketio_json
+        # Honour the documented logger flag; forcing it on made socketio and engineio
+        # format and write a log line for every order and trade packet
+        self.sid = socketio.Client(logger=logger, engineio_logger=logger, json=json)
         self.eventlistener = self.sid
         self.sid.on('connect', self.on_connect)
         self.sid.on('message', self.on_message)
@@ -59,9 +74,8 @@ class OrderSocket_io(socketio.Client):
 
         """Get root url from config file"""
         currDirMain = os.getcwd()
-        configParser = configparser.RawConfigParser()
         configFilePath = os.path.join(currDirMain, 'config.ini')
-        configParser.read(configFilePath)
+        configParser = _load_config(configFilePath)
         self.port = configParser.get('root_url', 'root').strip()
 
         port = f'{self.port}/?token='
@@ -0,0 +1,39 @@
+"""
+    JsonCodec.py
+
+    JSON codecs shared by the REST client and the Socket.IO clients.
+    orjson is used when it is installed, otherwise the stdlib module.
+"""
+import functools
+import json
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    orjson = None
+
+# Codec for REST request bodies and responses. orjson encodes to compact bytes
+# and parses bytes natively, several times faster than the stdlib module.
+if orjson is not None:
+    dumps = orjson.dumps
+    loads = orjson.loads
+else:
+    # Match orjson's compact output so request bodies don't carry separator padding
+    dumps = functools.partial(json.dumps, separators=(",", ":"))
+    loads = json.loads
+
+
+class _OrjsonSocketIOCodec:
+    """Drop-in ``json`` module for python-socketio backed by orjson.
+    Socket.IO frames are text, so encoded bytes are decoded back to str."""
+
+    @staticmethod
+    def dumps(obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    @staticmethod
+    def loads(s, **kwargs):
+        return orjson.loads(s)
+
+
+# `json` argument for socketio.Client; None lets python-socketio use the stdlib module
+socketio_json = _OrjsonSocketIOCodec if orjson is not None else None
@@ -1,9 +1,20 @@
 import configparser
+import functools
 import os
 from datetime import datetime
 
 import socketio
 
+from JsonCodec import socketio_json
+
+
+@functools.lru_cache(maxsize=None)
+def _load_config(configFilePath):
+    """Parse config.ini once per path; every client instance shares the result."""
+    configParser = configparser.ConfigParser()
+    configParser.read(configFilePath)
+    return configParser
+
 
 class MDSocket_io(socketio.Client):
     """A Socket.IO client.
@@ -42,7 +53,9 @@ class MDSocket_io(socketio.Client):
     def __init__(self, token, userID, reconnection=True, reconnection_attempts=0, reconnection_delay=1,
                  reconnection_delay_max=50000, randomization_factor=0.5, logger=False, binary=False, json=None,
                  **kwargs):
-        self.sid = socketio.Client(logger=False, engineio_logger=False)
+        if json is None:
+            json = socketio_json
+        self.sid = socketio.Client(logger=False, engineio_logger=False, json=json)
         self.eventlistener = self.sid
 
         self.sid.on('connect', self.on_connect)
@@ -69,9 +82,8 @@ class MDSocket_io(socketio.Client):
 
         """Get the root url from config file"""
         currDirMain = os.getcwd()
-        configParser = configparser.ConfigParser()
         configFilePath = os.path.join(currDirMain, 'config.ini')
-        configParser.read(configFilePath)
+        configParser = _load_config(configFilePath)
 
         self.port = configParser.get('root_url', 'root')
         self.userID = userID
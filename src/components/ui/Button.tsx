@@ -9,6 +9,24 @@ export interface ButtonProps extends React.ButtonHTMLAttributes<HTMLButtonElemen
   rightIcon?: React.ReactNode;
 }
 
+// Class maps are static, so build them once instead of on every render
+const baseStyles =
+  'inline-flex items-center justify-center font-medium transition-all duration-200 rounded-lg focus:outline-none focus:ring-2 focus:ring-offset-2 disabled:opacity-50 disabled:cursor-not-allowed';
+
+const variants: Record<NonNullable<ButtonProps['variant']>, string> = {
+  primary: 'bg-primary text-white hover:bg-primary-700 focus:ring-primary-500',
+  secondary: 'bg-secondary text-white hover:bg-secondary-700 focus:ring-secondary-500',
+  danger: 'bg-loss text-white hover:bg-red-600 focus:ring-red-500',
+  ghost: 'bg-transparent hover:bg-muted text-foreground focus:ring-accent',
+  outline: 'border-2 border-border bg-transparent hover:bg-muted text-foreground focus:ring-accent',
+};
+
+const sizes: Record<NonNullable<ButtonProps['size']>, string> = {
+  sm: 'px-3 py-1.5 text-sm',
+  md: 'px-4 py-2 text-base',
+  lg: 'px-6 py-3 text-lg',
+};
+
 const Button = React.forwardRef<HTMLButtonElement, ButtonProps>(
   (
     {
@@ -24,22 +42,6 @@ const Button = React.forwardRef<HTMLButtonElement, ButtonProps>(
     },
     ref
   ) => {
-    const baseStyles = 'inline-flex items-center justify-center font-medium transition-all duration-200 rounded-lg focus:outline-none focus:ring-2 focus:ring-offset-2 disabled:opacity-50 disabled:cursor-not-allowed';
-
-    const variants = {
-      primary: 'bg-primary text-white hover:bg-primary-700 focus:ring-primary-500',
-      secondary: 'bg-secondary text-white hover:bg-secondary-700 focus:ring-secondary-500',
-      danger: 'bg-loss text-white hover:bg-red-600 focus:ring-red-500',
-      ghost: 'bg-transparent hover:bg-muted text-foreground focus:ring-accent',
-      outline: 'border-2 border-border bg-transparent hover:bg-muted text-foreground focus:ring-accent',
-    };
-
-    const sizes = {
-      sm: 'px-3 py-1.5 text-sm',
-      md: 'px-4 py-2 text-base',
-      lg: 'px-6 py-3 text-lg',
-    };
-
     return (
       <button
         ref={ref}
@@ -5,23 +5,24 @@ export interface CardProps extends React.HTMLAttributes<HTMLDivElement> {
   padding?: 'none' | 'sm' | 'md' | 'lg';
 }
 
+// Class maps are static, so build them once instead of on every render
+const baseStyles = 'rounded-lg bg-background transition-all duration-200';
+
+const variants: Record<NonNullable<CardProps['variant']>, string> = {
+  default: 'border border-border',
+  bordered: 'border-2 border-border',
+  elevated: 'shadow-lg border border-border/50',
+};
+
+const paddings: Record<NonNullable<CardProps['padding']>, string> = {
+  none: '',
+  sm: 'p-4',
+  md: 'p-6',
+  lg: 'p-8',
+};
+
 const Card = React.forwardRef<HTMLDivElement, CardProps>(
   ({ className = '', variant = 'default', padding = 'md', children, ...props }, ref) => {
-    const baseStyles = 'rounded-lg bg-background transition-all duration-200';
-
-    const variants = {
-      default: 'border border-border',
-      bordered: 'border-2 border-border',
-      elevated: 'shadow-lg border border-border/50',
-    };
-
-    const paddings = {
-      none: '',
-      sm: 'p-4',
-      md: 'p-6',
-      lg: 'p-8',
-    };
-
     return (
       <div
         ref={ref}
@@ -6,22 +6,37 @@ interface PasswordStrengthProps {
   className?: string;
 }
 
-interface PasswordRequirement {
-  label: string;
-  test: (password: string) => boolean;
-}
-
-const requirements: PasswordRequirement[] = [
-  { label: 'At least 8 characters', test: (pwd) => pwd.length >= 8 },
-  { label: 'One uppercase letter', test: (pwd) => /[A-Z]/.test(pwd) },
-  { label: 'One lowercase letter', test: (pwd) => /[a-z]/.test(pwd) },
-  { label: 'One number', test: (pwd) => /\d/.test(pwd) },
-  { label: 'One special character', test: (pwd) => /[!@#$%^&*(),.?":{}|<>]/.test(pwd) },
+const requirements = [
+  'At least 8 characters',
+  'One uppercase letter',
+  'One lowercase letter',
+  'One number',
+  'One special character',
 ];
 
+const SPECIAL_CHARACTERS = '!@#$%^&*(),.?":{}|<>';
+
+// Scan the password once and report which requirements it meets, in `requirements` order
+const checkRequirements = (pwd: string): boolean[] => {
+  let hasUpper = false;
+  let hasLower = false;
+  let hasDigit = false;
+  let hasSpecial = false;
+
+  for (let i = 0; i < pwd.length; i++) {
+    const code = pwd.charCodeAt(i);
+    if (code >= 65 && code <= 90) hasUpper = true;
+    else if (code >= 97 && code <= 122) hasLower = true;
+    else if (code >= 48 && code <= 57) hasDigit = true;
+    else if (SPECIAL_CHARACTERS.includes(pwd[i])) hasSpecial = true;
+  }
+
+  return [pwd.length >= 8, hasUpper, hasLower, hasDigit, hasSpecial];
+};
+
 const PasswordStrength: React.FC<PasswordStrengthProps> = ({ password, className = '' }) => {
-  const metRequirements = requirements.filter((req) => req.test(password));
-  const strength = metRequirements.length;
+  const metRequirements = checkRequirements(password);
+  const strength = metRequirements.filter(Boolean).length;
 
   const getStrengthColor = () => {
     if (strength === 0) return 'bg-border';
@@ -71,8 +86,8 @@ const PasswordStrength: React.FC<PasswordStrengthProps> = ({ password, className
 
       {/* Requirements List */}
       <div className="space-y-2">
-        {requirements.map((req, index) => {
-          const isMet = req.test(password);
+        {requirements.map((label, index) => {
+          const isMet = metRequirements[index];
           return (
             <div key={index} className="flex items-center gap-2 text-sm">
               {isMet ? (
@@ -81,7 +96,7 @@ const PasswordStrength: React.FC<PasswordStrengthProps> = ({ password, className
                 <X className="h-4 w-4 text-muted-foreground flex-shrink-0" />
               )}
               <span className={isMet ? 'text-profit' : 'text-muted-foreground'}>
-                {req.label}
+                {label}
               </span>
             </div>
           );
@@ -1,8 +1,8 @@
-import React, { createContext, useContext, useState, useEffect } from 'react';
+import React, { createContext, useContext, useState, useEffect, useRef } from 'react';
 import { supabase } from '../lib/supabase';
 import type { Database } from '../lib/supabase';
 import type { User as SupabaseUser } from '@supabase/supabase-js';
-import { auditAuth } from '../lib/auditLog';
+import { auditAuth, flushAuditEvents } from '../lib/auditLog';
 
 export interface User {
   id: string;
@@ -37,8 +37,38 @@ export interface RegisterData {
   role: 'master' | 'follower';
 }
 
+// Only the profile columns the app's User shape is built from
+const USER_PROFILE_COLUMNS =
+  'id, email, name, role, phone, is_email_verified, is_kyc_verified, has_2fa_enabled, onboarding_completed';
+
+type ProfileRow = Pick<
+  Database['public']['Tables']['profiles']['Row'],
+  | 'id'
+  | 'email'
+  | 'name'
+  | 'role'
+  | 'phone'
+  | 'is_email_verified'
+  | 'is_kyc_verified'
+  | 'has_2fa_enabled'
+  | 'onboarding_completed'
+>;
+
 const AuthContext = createContext<AuthContextType | undefined>(undefined);
 
+// Map a profiles row to the app's User shape
+const toUser = (profile: ProfileRow): User => ({
+  id: profile.id,
+  email: profile.email,
+  name: profile.name,
+  role: profile.role,
+  phone: profile.phone || undefined,
+  isEmailVerified: profile.is_email_verified,
+  isKYCVerified: profile.is_kyc_verified,
+  has2FAEnabled: profile.has_2fa_enabled,
+  onboardingCompleted: profile.onboarding_completed,
+});
+
 export const useAuth = () => {
   const context = useContext(AuthContext);
   if (!context) {
@@ -52,32 +82,44 @@ export const AuthProvider: React.FC<{ children: React.ReactNode }> = ({ children
   const [isLoading, setIsLoading] = useState(true);
   const [needs2FA, setNeeds2FA] = useState(false);
   const [tempCredentials, setTempCredentials] = useState<{ email: string; password: string } | null>(null);
+  // Profile load for the current session user, shared by login and the auth state listener
+  const profileLoad = useRef<{ userId: string; promise: Promise<User | null> } | null>(null);
+
+  // Fetch the user profile once per signed-in user; pass `force` to re-read it
+  const fetchUserProfile = (userId: string, force: boolean = false): Promise<User | null> => {
+    if (!force && profileLoad.current?.userId === userId) {
+      return profileLoad.current.promise;
+    }
+
+    const promise = loadUserProfile(userId).catch((error) => {
+      if (profileLoad.current?.promise === promise) {
+        profileLoad.current = null;
+      }
+      throw error;
+    });
+    profileLoad.current = { userId, promise };
+
+    return promise;
+  };
 
   // Helper function to fetch user profile from database
-  const fetchUserProfile = async (userId: string) => {
+  const loadUserProfile = async (userId: string): Promise<User | null> => {
     try {
       const { data: profile, error } = await supabase
         .from('profiles')
-        .select('*')
+        .select(USER_PROFILE_COLUMNS)
         .eq('id', userId)
         .single();
 
       if (error) throw error;
 
-      if (profile) {
-        const userData: User = {
-          id: profile.id,
-          email: profile.email,
-          name: profile.name,
-          role: profile.role,
-          phone: profile.phone || undefined,
-          isEmailVerified: profile.is_email_verified,
-          isKYCVerified: profile.is_kyc_verified,
-          has2FAEnabled: profile.has_2fa_enabled,
-          onboardingCompleted: profile.onboarding_completed,
-        };
-        setUser(userData);
+      if (!profile) {
+        return null;
       }
+
+      const userData = toUser(profile);
+      setUser(userData);
+      return userData;
     } catch (error) {
       console.error('Failed to fetch user profile:', error);
       throw error;
@@ -108,6 +150,7 @@ export const AuthProvider: React.FC<{ children: React.ReactNode }> = ({ children
         if (event === 'SIGNED_IN' && session?.user) {
           await fetchUserProfile(session.user.id);
         } else if (event === 'SIGNED_OUT') {
+          profileLoad.current = null;
           setUser(null);
         }
       }
@@ -131,17 +174,10 @@ export const AuthProvider: React.FC<{ children: React.ReactNode }> = ({ children
       if (error) throw error;
 
       if (data.user) {
-        // Fetch user profile
-        await fetchUserProfile(data.user.id);
-
-        // Check if user has 2FA enabled
-        const { data: profile } = await supabase
-          .from('profiles')
-          .select('has_2fa_enabled')
-          .eq('id', data.user.id)
-          .single();
+        // Fetch user profile; it already carries the 2FA flag
+        const profile = await fetchUserProfile(data.user.id);
 
-        if (profile?.has_2fa_enabled) {
+        if (profile?.has2FAEnabled) {
           setTempCredentials({ email, password });
           setNeeds2FA(true);
           // Sign out temporarily until 2FA is verified
@@ -212,8 +248,8 @@ export const AuthProvider: React.FC<{ children: React.ReactNode }> = ({ children
       if (authError) throw authError;
 
       if (authData.user) {
-        // Create user profile in profiles table
-        const { error: profileError } = await supabase
+        // Create user profile in profiles table and get the stored row back in the same request
+        const { data: profile, error: profileError } = await supabase
           .from('profiles')
           .insert({
             id: authData.user.id,
@@ -225,12 +261,15 @@ export const AuthProvider: React.FC<{ children: React.ReactNode }> = ({ children
             is_kyc_verified: false,
             has_2fa_enabled: false,
             onboarding_completed: false,
-          });
+          })
+          .select(USER_PROFILE_COLUMNS)
+          .single();
 
         if (profileError) throw profileError;
 
-        // Fetch the newly created profile
-        await fetchUserProfile(authData.user.id);
+        const userData = toUser(profile);
+        setUser(userData);
+        profileLoad.current = { userId: authData.user.id, promise: Promise.resolve(userData) };
 
         // Log user registration
         auditAuth.register(authData.user.id, data.email, data.role);
@@ -248,6 +287,9 @@ export const AuthProvider: React.FC<{ children: React.ReactNode }> = ({ children
       auditAuth.logout(user.id);
     }
 
+    // Queued audit events must be written while the session is still valid
+    await flushAuditEvents();
+
     await supabase.auth.signOut();
     setUser(null);
     setNeeds2FA(false);
@@ -256,16 +298,21 @@ export const AuthProvider: React.FC<{ children: React.ReactNode }> = ({ children
 
   const updateUser = async (data: Partial<User>) => {
     if (user) {
-      // Map User fields to database column names
+      // Map changed User fields to database column names
       const dbData: Record<string, any> = {};
 
-      if (data.name !== undefined) dbData.name = data.name;
-      if (data.phone !== undefined) dbData.phone = data.phone;
-      if (data.role !== undefined) dbData.role = data.role;
-      if (data.isEmailVerified !== undefined) dbData.is_email_verified = data.isEmailVerified;
-      if (data.isKYCVerified !== undefined) dbData.is_kyc_verified = data.isKYCVerified;
-      if (data.has2FAEnabled !== undefined) dbData.has_2fa_enabled = data.has2FAEnabled;
-      if (data.onboardingCompleted !== undefined) dbData.onboarding_completed = data.onboardingCompleted;
+      if (data.name !== undefined && data.name !== user.name) dbData.name = data.name;
+      if (data.phone !== undefined && data.phone !== user.phone) dbData.phone = data.phone;
+      if (data.role !== undefined && data.role !== user.role) dbData.role = data.role;
+      if (data.isEmailVerified !== undefined && data.isEmailVerified !== user.isEmailVerified) dbData.is_email_verified = data.isEmailVerified;
+      if (data.isKYCVerified !== undefined && data.isKYCVerified !== user.isKYCVerified) dbData.is_kyc_verified = data.isKYCVerified;
+      if (data.has2FAEnabled !== undefined && data.has2FAEnabled !== user.has2FAEnabled) dbData.has_2fa_enabled = data.has2FAEnabled;
+      if (data.onboardingCompleted !== undefined && data.onboardingCompleted !== user.onboardingCompleted) dbData.onboarding_completed = data.onboardingCompleted;
+
+      // The loaded profile already has these values; skip the database round trip
+      if (Object.keys(dbData).length === 0) {
+        return;
+      }
 
       // Update profile in database
       const { error } = await supabase
@@ -1,4 +1,4 @@
-import axios from 'axios';
+import axios, { AxiosInstance } from 'axios';
 import { supabase } from '../supabase';
 
 // =====================================================
@@ -67,6 +67,14 @@ class OpenAIService {
   private readonly API_URL = 'https://api.openai.com/v1/chat/completions';
   private readonly MODEL = 'gpt-4o';
 
+  // Configured once so every completion request reuses the same auth headers
+  private readonly apiClient: AxiosInstance = axios.create({
+    headers: {
+      Authorization: `Bearer ${this.API_KEY}`,
+      'Content-Type': 'application/json',
+    },
+  });
+
   /**
    * Analyze market sentiment for a symbol
    */
@@ -314,22 +322,13 @@ class OpenAIService {
    */
   private async callOpenAI(messages: Array<{ role: string; content: string }>): Promise<string> {
     try {
-      const response = await axios.post(
-        this.API_URL,
-        {
-          model: this.MODEL,
-          messages,
-          temperature: 0.7,
-          max_tokens: 2000,
-          response_format: { type: 'json_object' },
-        },
-        {
-          headers: {
-            Authorization: `Bearer ${this.API_KEY}`,
-            'Content-Type': 'application/json',
-          },
-        }
-      );
+      const response = await this.apiClient.post(this.API_URL, {
+        model: this.MODEL,
+        messages,
+        temperature: 0.7,
+        max_tokens: 2000,
+        response_format: { type: 'json_object' },
+      });
 
       return response.data.choices[0].message.content;
     } catch (error: any) {
@@ -346,7 +345,7 @@ class OpenAIService {
 Analyze the market sentiment for ${symbol} based on the following data:
 
 ${newsData ? `Recent News:\n${newsData.join('\n')}\n` : ''}
-${priceData ? `Price Data:\n${JSON.stringify(priceData, null, 2)}\n` : ''}
+${priceData ? `Price Data:\n${JSON.stringify(priceData)}\n` : ''}
 
 Provide a JSON response with the following structure:
 {
@@ -375,10 +374,10 @@ Analyze the following trading strategy and provide recommendations:
 Strategy ID: ${strategyId}
 
 Performance Data:
-${JSON.stringify(performanceData, null, 2)}
+${JSON.stringify(performanceData)}
 
 Risk Metrics:
-${JSON.stringify(riskMetrics, null, 2)}
+${JSON.stringify(riskMetrics)}
 
 Provide a JSON response with the following structure:
 {
@@ -407,7 +406,7 @@ Provide a JSON response with the following structure:
 Generate a comprehensive daily market summary for Indian stock markets:
 
 Market Data:
-${JSON.stringify(marketData, null, 2)}
+${JSON.stringify(marketData)}
 
 Provide a JSON response with the following structure:
 {
@@ -455,7 +454,7 @@ Provide a JSON array with the following structure:
     return `
 Analyze the following trading history:
 
-${JSON.stringify(trades, null, 2)}
+${JSON.stringify(trades)}
 
 Provide a JSON response with the following structure:
 {
@@ -475,10 +474,10 @@ Provide a JSON response with the following structure:
 Perform a risk assessment on the following portfolio:
 
 Portfolio:
-${JSON.stringify(portfolio, null, 2)}
+${JSON.stringify(portfolio)}
 
 Risk Metrics:
-${JSON.stringify(riskMetrics, null, 2)}
+${JSON.stringify(riskMetrics)}
 
 Provide a JSON response with the following structure:
 {
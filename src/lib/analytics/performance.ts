@@ -87,10 +87,10 @@ export class PerformanceAnalytics {
       const start = startDate || new Date(Date.now() - 90 * 24 * 60 * 60 * 1000); // 90 days ago
       const end = endDate || new Date();
 
-      // Get trades in date range
+      // Get trades in date range (only the fields the P&L pairing reads)
       const { data: trades } = await supabase
         .from('trades')
-        .select('*')
+        .select('symbol, side, price, quantity, commission, tax')
         .eq('user_id', userId)
         .gte('executed_at', start.toISOString())
         .lte('executed_at', end.toISOString())
@@ -226,21 +226,24 @@ export class PerformanceAnalytics {
    */
   async getStrategyPerformance(strategyId: string): Promise<StrategyPerformance | null> {
     try {
-      // Get strategy details
+      // Get strategy details with its active subscriber count embedded
       const { data: strategy } = await supabase
         .from('strategies')
-        .select('*, strategy_subscriptions(count)')
+        .select('*, active_subscriptions:strategy_subscriptions(count)')
         .eq('id', strategyId)
+        .eq('active_subscriptions.is_active', true)
         .single();
 
       if (!strategy) {
         return null;
       }
 
+      const activeSubscribers = strategy.active_subscriptions?.[0]?.count || 0;
+
       // Get strategy owner's trades for this strategy
       const { data: trades } = await supabase
         .from('trades')
-        .select('*')
+        .select('symbol, side, price, quantity, commission, tax')
         .eq('strategy_id', strategyId)
         .eq('user_id', strategy.master_id);
 
@@ -250,7 +253,7 @@ export class PerformanceAnalytics {
           strategyId,
           strategyName: strategy.name,
           totalSubscribers: strategy.total_subscribers,
-          activeSubscribers: 0,
+          activeSubscribers,
         };
       }
 
@@ -258,19 +261,12 @@ export class PerformanceAnalytics {
       const tradePnLs = this.calculateTradePnLs(trades);
       const metrics = await this.calculatePerformanceMetrics(strategy.master_id);
 
-      // Get active subscribers
-      const { count: activeSubscribers } = await supabase
-        .from('strategy_subscriptions')
-        .select('*', { count: 'exact', head: true })
-        .eq('strategy_id', strategyId)
-        .eq('is_active', true);
-
       return {
         ...metrics,
         strategyId,
         strategyName: strategy.name,
         totalSubscribers: strategy.total_subscribers,
-        activeSubscribers: activeSubscribers || 0,
+        activeSubscribers,
       };
     } catch (error) {
       console.error('Failed to get strategy performance:', error);
@@ -1,4 +1,4 @@
-import { supabase } from '../supabase';
+import { supabase, Json } from '../supabase';
 import { performanceAnalytics } from './performance';
 
 // =====================================================
@@ -120,7 +120,7 @@ export interface ComplianceReport {
     timestamp: string;
     action: string;
     entity: string;
-    details: string;
+    details: Json;
   }>;
 }
 
@@ -160,6 +160,8 @@ export interface TaxReport {
 // =====================================================
 
 class ReportingService {
+  private readonly TRADE_BATCH_SIZE = 500;
+
   /**
    * Generate comprehensive performance report
    */
@@ -221,30 +223,28 @@ class ReportingService {
    */
   async generateRiskReport(userId: string, startDate: Date, endDate: Date): Promise<RiskReport> {
     try {
-      // Get current portfolio
-      const { data: portfolio } = await supabase
-        .from('portfolios')
-        .select('*')
-        .eq('user_id', userId);
-
-      // Get account balance
-      const { data: balance } = await supabase
-        .from('account_balances')
-        .select('*')
-        .eq('user_id', userId)
-        .single();
+      // Get current portfolio and account balance together
+      const [{ data: portfolio }, { data: balance }] = await Promise.all([
+        supabase
+          .from('portfolios')
+          .select('*')
+          .eq('user_id', userId),
+        supabase
+          .from('account_balances')
+          .select('*')
+          .eq('user_id', userId)
+          .single(),
+      ]);
 
       // Calculate current risk
       const currentRisk = this.calculateCurrentRisk(portfolio || [], balance);
 
-      // Calculate risk metrics
-      const riskMetrics = await this.calculateRiskMetrics(userId, portfolio || []);
-
-      // Get risk events
-      const riskEvents = await this.getRiskEvents(userId, startDate, endDate);
-
-      // Get limit breaches
-      const limitBreaches = await this.getLimitBreaches(userId, startDate, endDate);
+      // Risk metrics, risk events and limit breaches don't depend on each other
+      const [riskMetrics, riskEvents, limitBreaches] = await Promise.all([
+        this.calculateRiskMetrics(userId, portfolio || []),
+        this.getRiskEvents(userId, startDate, endDate),
+        this.getLimitBreaches(userId, startDate, endDate),
+      ]);
 
       // Generate recommendations
       const recommendations = this.generateRiskRecommendations(currentRisk, riskMetrics);
@@ -276,7 +276,7 @@ class ReportingService {
       // Get KYC status
       const { data: kyc } = await supabase
         .from('user_kyc')
-        .select('*')
+        .select('document_type, verification_status, verified_at')
         .eq('user_id', userId)
         .single();
 
@@ -286,15 +286,13 @@ class ReportingService {
         lastVerified: kyc?.verified_at || 'Not verified',
       };
 
-      // Get trading activity
-      const { data: orders } = await supabase
-        .from('orders')
-        .select('*')
-        .eq('user_id', userId)
-        .gte('created_at', startDate.toISOString())
-        .lte('created_at', endDate.toISOString());
-
-      const tradingActivity = this.calculateTradingActivity(orders || []);
+      // Get trading activity, aggregated in the database
+      const { data: activityRows } = await supabase.rpc('get_user_order_activity', {
+        p_user_id: userId,
+        p_start: startDate.toISOString(),
+        p_end: endDate.toISOString(),
+      });
+      const activity = activityRows?.[0];
 
       // Get rule violations (from audit logs)
       const ruleViolations: any[] = []; // Implement based on your compliance rules
@@ -302,7 +300,7 @@ class ReportingService {
       // Get audit trail
       const { data: auditLogs } = await supabase
         .from('audit_logs')
-        .select('*')
+        .select('created_at, action, entity_type, details')
         .eq('user_id', userId)
         .gte('created_at', startDate.toISOString())
         .lte('created_at', endDate.toISOString())
@@ -314,7 +312,7 @@ class ReportingService {
           timestamp: log.created_at,
           action: log.action,
           entity: log.entity_type,
-          details: JSON.stringify(log.details),
+          details: log.details,
         })) || [];
 
       return {
@@ -322,10 +320,10 @@ class ReportingService {
         period: { start: startDate, end: endDate },
         kycStatus,
         tradingActivity: {
-          totalOrders: orders?.length || 0,
-          totalVolume: orders?.reduce((sum, o) => sum + o.quantity, 0) || 0,
-          largestOrder: Math.max(...(orders?.map((o) => o.quantity) || [0])),
-          frequentSymbols: this.getFrequentSymbols(orders || []),
+          totalOrders: activity?.total_orders || 0,
+          totalVolume: Number(activity?.total_volume || 0),
+          largestOrder: activity?.largest_order || 0,
+          frequentSymbols: activity?.frequent_symbols || [],
         },
         ruleViolations,
         auditTrail,
@@ -346,15 +344,13 @@ class ReportingService {
       const startDate = new Date(`${year}-04-01`);
       const endDate = new Date(`${parseInt(year) + 1}-03-31`);
 
-      // Get all closed positions
-      const { data: trades } = await supabase
-        .from('trades')
-        .select('*')
-        .eq('user_id', userId)
-        .gte('executed_at', startDate.toISOString())
-        .lte('executed_at', endDate.toISOString());
+      // Get all closed positions, a batch at a time
+      const trades: any[] = [];
+      for await (const batch of this.iterateTradeBatches(userId, startDate, endDate)) {
+        trades.push(...batch);
+      }
 
-      if (!trades || trades.length === 0) {
+      if (trades.length === 0) {
         return this.getEmptyTaxReport(userId, financialYear);
       }
 
@@ -433,6 +429,55 @@ class ReportingService {
   // PRIVATE HELPER METHODS
   // =====================================================
 
+  /**
+   * Page through a user's trades in a period by (executed_at, id) keyset
+   * Keeps each response bounded and isn't cut off by the API's max row limit
+   */
+  private async *iterateTradeBatches(
+    userId: string,
+    startDate: Date,
+    endDate: Date
+  ): AsyncGenerator<any[]> {
+    let after: { executedAt: string; id: string } | null = null;
+
+    while (true) {
+      let query = supabase
+        .from('trades')
+        .select('*')
+        .eq('user_id', userId)
+        .gte('executed_at', startDate.toISOString())
+        .lte('executed_at', endDate.toISOString());
+
+      if (after) {
+        query = query.or(
+          `executed_at.gt."${after.executedAt}",and(executed_at.eq."${after.executedAt}",id.gt.${after.id})`
+        );
+      }
+
+      const { data: batch, error } = await query
+        .order('executed_at', { ascending: true })
+        .order('id', { ascending: true })
+        .limit(this.TRADE_BATCH_SIZE);
+
+      if (error) {
+        throw error;
+      }
+
+      if (!batch || batch.length === 0) {
+        return;
+      }
+
+      yield batch;
+
+      if (batch.length < this.TRADE_BATCH_SIZE) {
+        return;
+      }
+
+      const last = batch[batch.length - 1];
+      after = { executedAt: last.executed_at, id: last.id };
+    }
+  }
+
   private async calculateSummary(userId: string, trades: any[]) {
     const pnl = await performanceAnalytics.calculateUserPnL(userId);
 
@@ -455,19 +500,6 @@ class ReportingService {
   private calculateTradingActivity(trades: any[]) {
     const dateMap = new Map<string, number>();
 
-    trades.forEach((trade) => {
-      const date = new Date(trade.executed_at || trade.created_at).toISOString().split('T')[0];
-      dateMap.set(date, (dateMap.get(date) || 0) + 1);
-    });
-
-    const totalDays = dateMap.size || 1;
-    const avgTradesPerDay = trades.length / totalDays;
-
-    const mostActiveDays = Array.from(dateMap.entries())
-      .map(([date, trades]) => ({ date, trades }))
-      .sort((a, b) => b.trades - a.trades)
-      .slice(0, 5);
-
     // Trading by time of day
     const tradingByTime: Record<string, number> = {
       '09:00-11:00': 0,
@@ -476,14 +508,27 @@ class ReportingService {
       '15:00-15:30': 0,
     };
 
+    // Parse each timestamp once for both the per-day and time-of-day tallies
     trades.forEach((trade) => {
-      const hour = new Date(trade.executed_at || trade.created_at).getHours();
+      const executedAt = new Date(trade.executed_at || trade.created_at);
+      const date = executedAt.toISOString().split('T')[0];
+      dateMap.set(date, (dateMap.get(date) || 0) + 1);
+
+      const hour = executedAt.getHours();
       if (hour >= 9 && hour < 11) tradingByTime['09:00-11:00']++;
       else if (hour >= 11 && hour < 13) tradingByTime['11:00-13:00']++;
       else if (hour >= 13 && hour < 15) tradingByTime['13:00-15:00']++;
       else if (hour >= 15) tradingByTime['15:00-15:30']++;
     });
 
+    const totalDays = dateMap.size || 1;
+    const avgTradesPerDay = trades.length / totalDays;
+
+    const mostActiveDays = Array.from(dateMap.entries())
+      .map(([date, trades]) => ({ date, trades }))
+      .sort((a, b) => b.trades - a.trades)
+      .slice(0, 5);
+
     return {
       avgTradesPerDay,
       mostActiveDays,
@@ -496,13 +541,15 @@ class ReportingService {
 
     trades.forEach((trade) => {
       const symbol = trade.symbol;
-      const current = symbolMap.get(symbol) || { trades: 0, pnl: 0, wins: 0 };
+      let current = symbolMap.get(symbol);
+      if (!current) {
+        current = { trades: 0, pnl: 0, wins: 0 };
+        symbolMap.set(symbol, current);
+      }
 
-      symbolMap.set(symbol, {
-        trades: current.trades + 1,
-        pnl: current.pnl + (trade.pnl || 0),
-        wins: current.wins + (trade.pnl > 0 ? 1 : 0),
-      });
+      current.trades++;
+      current.pnl += trade.pnl || 0;
+      if (trade.pnl > 0) current.wins++;
     });
 
     return Array.from(symbolMap.entries())
@@ -523,23 +570,24 @@ class ReportingService {
       const month = new Date(trade.executed_at || trade.created_at)
         .toISOString()
         .substring(0, 7);
-      const current = monthMap.get(month) || { trades: 0, pnl: 0, wins: 0 };
+      let current = monthMap.get(month);
+      if (!current) {
+        current = { trades: 0, pnl: 0, wins: 0 };
+        monthMap.set(month, current);
+      }
 
-      monthMap.set(month, {
-        trades: current.trades + 1,
-        pnl: current.pnl + (trade.pnl || 0),
-        wins: current.wins + (trade.pnl > 0 ? 1 : 0),
-      });
+      current.trades++;
+      current.pnl += trade.pnl || 0;
+      if (trade.pnl > 0) current.wins++;
     });
 
-    return Array.from(monthMap.entries())
-      .map(([month, data]) => ({
-        month,
-        trades: data.trades,
-        pnl: data.pnl,
-        winRate: data.trades > 0 ? (data.wins / data.trades) * 100 : 0,
-      }))
-      .sort((a, b) => a.month.localeCompare(b.month));
+    // Trades arrive ordered by executed_at, so months were inserted in chronological order
+    return Array.from(monthMap.entries()).map(([month, data]) => ({
+      month,
+      trades: data.trades,
+      pnl: data.pnl,
+      winRate: data.trades > 0 ? (data.wins / data.trades) * 100 : 0,
+    }));
   }
 
   private calculateCurrentRisk(portfolio: any[], balance: any) {
@@ -602,19 +650,6 @@ class ReportingService {
     return recommendations;
   }
 
-  private getFrequentSymbols(orders: any[]): string[] {
-    const symbolCount = new Map<string, number>();
-
-    orders.forEach((order) => {
-      symbolCount.set(order.symbol, (symbolCount.get(order.symbol) || 0) + 1);
-    });
-
-    return Array.from(symbolCount.entries())
-      .sort((a, b) => b[1] - a[1])
-      .slice(0, 5)
-      .map(([symbol]) => symbol);
-  }
-
   private calculateCapitalGains(trades: any[]) {
     const shortTerm = { totalGains: 0, totalLosses: 0, netGains: 0 };
     const longTerm = { totalGains: 0, totalLosses: 0, netGains: 0 };
@@ -42,6 +42,18 @@ export interface IIFLOrderResponse {
   timestamp: number;
 }
 
+// Order payload as returned on the wire by the order and square-off endpoints
+type IIFLOrderPayload = Omit<IIFLOrderResponse, 'timestamp'>;
+
+// Quote as returned on the wire by the market quote endpoint
+interface IIFLQuotePayload {
+  symbol: string;
+  lastTradedPrice: number;
+  change: number;
+  changePercent: number;
+  volume: number;
+}
+
 export interface IIFLPosition {
   symbol: string;
   exchange: string;
@@ -66,9 +78,26 @@ export interface IIFLBalance {
 export class IIFLClient {
   private apiClient: AxiosInstance;
   private credentials: IIFLCredentials;
-  private authToken: string | null = null;
-  private tokenExpiresAt: number = 0;
+  private authHeader: string | null = null; // "Bearer <token>", built once per login
+  private tokenRefreshAt: number = 0; // Monotonic (performance.now) deadline to re-login
+  private readonly TOKEN_REFRESH_BUFFER = 5 * 60 * 1000; // Re-login 5 minutes before expiry
+  private pendingLogin: Promise<IIFLAuthResponse> | null = null; // Login shared by concurrent requests
   private baseURL: string;
+  private readonly RATE_LIMIT_PER_SECOND = 10; // Broker API request cap
+  private readonly MIN_RATE_PER_SECOND = 1; // Floor for multiplicative decrease
+  private readonly RATE_INCREASE_STEP = 0.5; // Additive increase per healthy response
+  private rateLimit: number = this.RATE_LIMIT_PER_SECOND; // Current AIMD-adjusted rate
+  private rateTokens: number = this.RATE_LIMIT_PER_SECOND;
+  private rateRefilledAt: number = performance.now();
+  private rateBlockedUntil: number = 0; // Set from Retry-After on 429s
+  private readonly MAX_RETRIES = 3;
+  private readonly RETRY_BASE_DELAY = 1000; // 1 second, doubled per attempt
+  private readonly RETRY_MAX_DELAY = 30000; // 30 second cap
+  private readonly RETRY_JITTER = 0.5; // Up to +50% random delay
+  private orderStatusCache: Map<string, { expiresAt: number; status: Promise<IIFLOrderResponse> }> =
+    new Map();
+  private readonly ORDER_STATUS_TTL = 500; // Open orders are re-polled after 500ms
+  private readonly ORDER_STATUS_CACHE_SIZE = 1000; // Oldest entries are dropped past this
 
   constructor(credentials: IIFLCredentials, isProduction: boolean = false) {
     this.credentials = credentials;
@@ -88,22 +117,122 @@ export class IIFLClient {
     // Request interceptor to add auth token
     this.apiClient.interceptors.request.use(
       async (config) => {
+        await this.acquireRateToken();
         await this.ensureAuthenticated();
-        if (this.authToken) {
-          config.headers.Authorization = `Bearer ${this.authToken}`;
+        if (this.authHeader) {
+          config.headers.Authorization = this.authHeader;
         }
         return config;
       },
       (error) => Promise.reject(error)
     );
 
-    // Response interceptor for error handling
+    // Response interceptor for rate feedback and error handling
     this.apiClient.interceptors.response.use(
-      (response) => response,
-      this.handleError.bind(this)
+      (response) => {
+        this.increaseRate();
+        return response;
+      },
+      (error) => {
+        this.applyBackpressure(error);
+        // Callers map the error with handleError once retries are exhausted
+        return Promise.reject(error);
+      }
     );
   }
 
+  // =====================================================
+  // RATE LIMITING
+  // =====================================================
+
+  /**
+   * Take a token from the request bucket, waiting until one is available.
+   * Uses the monotonic clock, and reserves the token before sleeping so
+   * concurrent callers queue up at the refill rate instead of bursting together.
+   */
+  private async acquireRateToken(): Promise<void> {
+    const now = performance.now();
+    const refill = ((now - this.rateRefilledAt) / 1000) * this.rateLimit;
+
+    this.rateTokens = Math.min(this.rateLimit, this.rateTokens + refill);
+    this.rateRefilledAt = now;
+    this.rateTokens -= 1;
+
+    const tokenWaitMs = this.rateTokens < 0 ? (-this.rateTokens / this.rateLimit) * 1000 : 0;
+    const waitMs = Math.max(tokenWaitMs, this.rateBlockedUntil - now);
+
+    if (waitMs > 0) {
+      await new Promise((resolve) => setTimeout(resolve, waitMs));
+    }
+  }
+
+  /**
+   * Additive increase: creep back toward the request cap while the broker is healthy
+   */
+  private increaseRate(): void {
+    this.rateLimit = Math.min(this.RATE_LIMIT_PER_SECOND, this.rateLimit + this.RATE_INCREASE_STEP);
+  }
+
+  /**
+   * Multiplicative decrease on 429/5xx, honouring the broker's Retry-After if sent
+   */
+  private applyBackpressure(error: any): void {
+    const status = axios.isAxiosError(error) ? error.response?.status : undefined;
+    if (!status || (status !== 429 && status < 500)) {
+      return;
+    }
+
+    this.rateLimit = Math.max(this.MIN_RATE_PER_SECOND, this.rateLimit / 2);
+    this.rateTokens = Math.min(this.rateTokens, 0);
+
+    const retryAfter = Number(error.response?.headers?.['retry-after']);
+    if (status === 429 && retryAfter > 0) {
+      this.rateBlockedUntil = Math.max(this.rateBlockedUntil, performance.now() + retryAfter * 1000);
+    }
+  }
+
+  // =====================================================
+  // RETRIES
+  // =====================================================
+
+  /**
+   * Run a request, retrying transient failures with exponential backoff and jitter.
+   * Non-idempotent requests (order placement) are only retried when the broker
+   * explicitly refused them, so a retry can never duplicate an order.
+   */
+  private async withRetry<T>(request: () => Promise<T>, idempotent: boolean = true): Promise<T> {
+    for (let attempt = 0; ; attempt++) {
+      try {
+        return await request();
+      } catch (error) {
+        if (attempt >= this.MAX_RETRIES || !this.isRetryable(error, idempotent)) {
+          throw error;
+        }
+
+        const backoff = Math.min(this.RETRY_MAX_DELAY, this.RETRY_BASE_DELAY * 2 ** attempt);
+        const delay = backoff * (1 + Math.random() * this.RETRY_JITTER);
+        await new Promise((resolve) => setTimeout(resolve, delay));
+      }
+    }
+  }
+
+  /**
+   * Transient errors: timeouts, dropped connections, throttling and gateway errors
+   */
+  private isRetryable(error: any, idempotent: boolean): boolean {
+    if (!axios.isAxiosError(error)) {
+      return false;
+    }
+
+    const status = error.response?.status;
+
+    if (!idempotent) {
+      return status === 429 || status === 503;
+    }
+
+    return status === undefined || [429, 500, 502, 503, 504].includes(status);
+  }
+
   // =====================================================
   // AUTHENTICATION
   // =====================================================
@@ -113,19 +242,23 @@ export class IIFLClient {
    */
   async authenticate(): Promise<IIFLAuthResponse> {
     try {
-      const response = await axios.post(`${this.baseURL}/auth/login`, {
-        apiKey: this.credentials.apiKey,
-        apiSecret: this.credentials.apiSecret,
-        vendorCode: this.credentials.vendorCode,
-      });
+      const { data } = await axios.post<{ token: string; userId: string; expiresIn: number }>(
+        `${this.baseURL}/auth/login`,
+        {
+          apiKey: this.credentials.apiKey,
+          apiSecret: this.credentials.apiSecret,
+          vendorCode: this.credentials.vendorCode,
+        }
+      );
 
-      this.authToken = response.data.token;
-      this.tokenExpiresAt = Date.now() + (response.data.expiresIn * 1000);
+      const expiresInMs = data.expiresIn * 1000;
+      this.authHeader = `Bearer ${data.token}`;
+      this.tokenRefreshAt = performance.now() + expiresInMs - this.TOKEN_REFRESH_BUFFER;
 
       return {
-        token: response.data.token,
-        userId: response.data.userId,
-        expiresAt: this.tokenExpiresAt,
+        token: data.token,
+        userId: data.userId,
+        expiresAt: Date.now() + expiresInMs,
       };
     } catch (error) {
       throw this.handleError(error);
@@ -136,12 +269,19 @@ export class IIFLClient {
    * Ensure valid authentication before API calls
    */
   private async ensureAuthenticated(): Promise<void> {
-    const now = Date.now();
-    const bufferTime = 5 * 60 * 1000; // 5 minutes buffer
+    // Fast path: a valid token needs no coordination
+    if (this.authHeader && performance.now() < this.tokenRefreshAt) {
+      return;
+    }
 
-    if (!this.authToken || now >= this.tokenExpiresAt - bufferTime) {
-      await this.authenticate();
+    // Requests arriving while a login is in flight wait for it instead of starting their own
+    if (!this.pendingLogin) {
+      this.pendingLogin = this.authenticate().finally(() => {
+        this.pendingLogin = null;
+      });
     }
+
+    await this.pendingLogin;
   }
 
   /**
@@ -150,8 +290,8 @@ export class IIFLClient {
   async logout(): Promise<void> {
     try {
       await this.apiClient.post('/auth/logout');
-      this.authToken = null;
-      this.tokenExpiresAt = 0;
+      this.authHeader = null;
+      this.tokenRefreshAt = 0;
     } catch (error) {
       throw this.handleError(error);
     }
@@ -168,16 +308,22 @@ export class IIFLClient {
     try {
       const startTime = performance.now();
 
-      const response = await this.apiClient.post('/orders', orderRequest);
+      const { data } = await this.withRetry(
+        () => this.apiClient.post<IIFLOrderPayload>('/orders', orderRequest),
+        false
+      );
 
-      const latency = performance.now() - startTime;
-      console.log(`Order placement latency: ${latency.toFixed(2)}ms`);
+      // Latency tracing is dev-only; production order placement shouldn't pay for console I/O
+      if (import.meta.env.DEV) {
+        const latency = performance.now() - startTime;
+        console.debug(`Order placement latency: ${latency.toFixed(2)}ms`);
+      }
 
       return {
-        orderId: response.data.orderId,
-        status: response.data.status,
-        message: response.data.message,
-        exchangeOrderId: response.data.exchangeOrderId,
+        orderId: data.orderId,
+        status: data.status,
+        message: data.message,
+        exchangeOrderId: data.exchangeOrderId,
         timestamp: Date.now(),
       };
     } catch (error) {
@@ -193,12 +339,13 @@ export class IIFLClient {
     modifications: Partial<IIFLOrderRequest>
   ): Promise<IIFLOrderResponse> {
     try {
-      const response = await this.apiClient.put(`/orders/${orderId}`, modifications);
+      const { data } = await this.apiClient.put<IIFLOrderPayload>(`/orders/${orderId}`, modifications);
+      this.orderStatusCache.delete(orderId);
 
       return {
-        orderId: response.data.orderId,
-        status: response.data.status,
-        message: response.data.message,
+        orderId: data.orderId,
+        status: data.status,
+        message: data.message,
         timestamp: Date.now(),
       };
     } catch (error) {
@@ -211,12 +358,13 @@ export class IIFLClient {
    */
   async cancelOrder(orderId: string): Promise<IIFLOrderResponse> {
     try {
-      const response = await this.apiClient.delete(`/orders/${orderId}`);
+      const { data } = await this.apiClient.delete<IIFLOrderPayload>(`/orders/${orderId}`);
+      this.orderStatusCache.delete(orderId);
 
       return {
-        orderId: response.data.orderId,
+        orderId: data.orderId,
         status: 'CANCELLED',
-        message: response.data.message,
+        message: data.message,
         timestamp: Date.now(),
       };
     } catch (error) {
@@ -226,16 +374,57 @@ export class IIFLClient {
 
   /**
    * Get order status
+   * Polls for the same order share one in-flight request and a short-lived result;
+   * filled, rejected and cancelled orders can't change, so those are kept until evicted
+   */
+  getOrderStatus(orderId: string): Promise<IIFLOrderResponse> {
+    const cached = this.orderStatusCache.get(orderId);
+    const now = performance.now();
+
+    if (cached && now < cached.expiresAt) {
+      return cached.status;
+    }
+
+    const status = this.fetchOrderStatus(orderId);
+    const entry = { expiresAt: now + this.ORDER_STATUS_TTL, status };
+
+    this.orderStatusCache.delete(orderId);
+    this.orderStatusCache.set(orderId, entry);
+    if (this.orderStatusCache.size > this.ORDER_STATUS_CACHE_SIZE) {
+      this.orderStatusCache.delete(this.orderStatusCache.keys().next().value!);
+    }
+
+    status.then(
+      (response) => {
+        if (response.status !== 'PENDING' && response.status !== 'SUBMITTED') {
+          entry.expiresAt = Infinity;
+        }
+      },
+      () => {
+        // Don't keep failed lookups around
+        if (this.orderStatusCache.get(orderId) === entry) {
+          this.orderStatusCache.delete(orderId);
+        }
+      }
+    );
+
+    return status;
+  }
+
+  /**
+   * Fetch order status from the broker
    */
-  async getOrderStatus(orderId: string): Promise<IIFLOrderResponse> {
+  private async fetchOrderStatus(orderId: string): Promise<IIFLOrderResponse> {
     try {
-      const response = await this.apiClient.get(`/orders/${orderId}`);
+      const { data } = await this.withRetry(() =>
+        this.apiClient.get<IIFLOrderPayload>(`/orders/${orderId}`)
+      );
 
       return {
-        orderId: response.data.orderId,
-        status: response.data.status,
-        message: response.data.message,
-        exchangeOrderId: response.data.exchangeOrderId,
+        orderId: data.orderId,
+        status: data.status,
+        message: data.message,
+        exchangeOrderId: data.exchangeOrderId,
         timestamp: Date.now(),
       };
     } catch (error) {
@@ -248,8 +437,8 @@ export class IIFLClient {
    */
   async getOrders(): Promise<IIFLOrderResponse[]> {
     try {
-      const response = await this.apiClient.get('/orders');
-      return response.data.orders || [];
+      const { data } = await this.apiClient.get<{ orders?: IIFLOrderResponse[] }>('/orders');
+      return data.orders || [];
     } catch (error) {
       throw this.handleError(error);
     }
@@ -264,8 +453,10 @@ export class IIFLClient {
    */
   async getPositions(): Promise<IIFLPosition[]> {
     try {
-      const response = await this.apiClient.get('/positions');
-      return response.data.positions || [];
+      const { data } = await this.withRetry(() =>
+        this.apiClient.get<{ positions?: IIFLPosition[] }>('/positions')
+      );
+      return data.positions || [];
     } catch (error) {
       throw this.handleError(error);
     }
@@ -276,14 +467,14 @@ export class IIFLClient {
    */
   async squareOffPosition(symbol: string, exchange: string): Promise<IIFLOrderResponse> {
     try {
-      const response = await this.apiClient.post('/positions/square-off', {
+      const { data } = await this.apiClient.post<IIFLOrderPayload>('/positions/square-off', {
         symbol,
         exchange,
       });
 
       return {
-        orderId: response.data.orderId,
-        status: response.data.status,
+        orderId: data.orderId,
+        status: data.status,
         message: 'Position squared off successfully',
         timestamp: Date.now(),
       };
@@ -312,13 +503,15 @@ export class IIFLClient {
    */
   async getBalance(): Promise<IIFLBalance> {
     try {
-      const response = await this.apiClient.get('/account/balance');
+      const { data } = await this.withRetry(() =>
+        this.apiClient.get<IIFLBalance>('/account/balance')
+      );
 
       return {
-        availableBalance: response.data.availableBalance,
-        usedMargin: response.data.usedMargin,
-        totalBalance: response.data.totalBalance,
-        collateral: response.data.collateral,
+        availableBalance: data.availableBalance,
+        usedMargin: data.usedMargin,
+        totalBalance: data.totalBalance,
+        collateral: data.collateral,
       };
     } catch (error) {
       throw this.handleError(error);
@@ -341,16 +534,16 @@ export class IIFLClient {
     timestamp: number;
   }> {
     try {
-      const response = await this.apiClient.get('/market/quote', {
+      const { data } = await this.apiClient.get<IIFLQuotePayload>('/market/quote', {
         params: { symbol, exchange },
       });
 
       return {
-        symbol: response.data.symbol,
-        ltp: response.data.lastTradedPrice,
-        change: response.data.change,
-        changePercent: response.data.changePercent,
-        volume: response.data.volume,
+        symbol: data.symbol,
+        ltp: data.lastTradedPrice,
+        change: data.change,
+        changePercent: data.changePercent,
+        volume: data.volume,
         timestamp: Date.now(),
       };
     } catch (error) {
@@ -400,7 +593,7 @@ export class IIFLClient {
 
         switch (status) {
           case 401:
-            this.authToken = null;
+            this.authHeader = null;
             return new Error('Authentication failed. Please check your API credentials.');
           case 403:
             return new Error('Access forbidden. Insufficient permissions.');
@@ -425,13 +618,29 @@ export class IIFLClient {
 // FACTORY FUNCTIONS
 // =====================================================
 
+// Authenticated clients by environment and credentials, shared by every caller
+const iiflClients = new Map<string, Promise<IIFLClient>>();
+
 /**
  * Create IIFL client from encrypted credentials
+ * Returns the existing client (and its connection and session) for credentials seen before
  */
-export async function createIIFLClient(
+export function createIIFLClient(
   encryptedCredentials: { apiKey: string; apiSecret: string; vendorCode?: string },
   isProduction: boolean = false
 ): Promise<IIFLClient> {
+  const cacheKey = [
+    isProduction ? 'prod' : 'sandbox',
+    encryptedCredentials.apiKey,
+    encryptedCredentials.apiSecret,
+    encryptedCredentials.vendorCode || '',
+  ].join(':');
+
+  const existing = iiflClients.get(cacheKey);
+  if (existing) {
+    return existing;
+  }
+
   // In production, decrypt the credentials
   // For now, we'll use them as-is
   const credentials: IIFLCredentials = {
@@ -441,9 +650,17 @@ export async function createIIFLClient(
   };
 
   const client = new IIFLClient(credentials, isProduction);
-  await client.authenticate();
+  const pending = client.authenticate().then(() => client);
+  iiflClients.set(cacheKey, pending);
+
+  // Don't keep a client whose first login failed
+  pending.catch(() => {
+    if (iiflClients.get(cacheKey) === pending) {
+      iiflClients.delete(cacheKey);
+    }
+  });
 
-  return client;
+  return pending;
 }
 
 /**
@@ -1,4 +1,4 @@
-import { supabase } from './supabase';
+import { supabase, supabaseUrl, supabaseAnonKey } from './supabase';
 
 export type AuditAction =
   | 'user.login'
@@ -29,19 +29,33 @@ interface AuditLogEntry {
   user_agent?: string;
 }
 
+const AUDIT_FLUSH_DELAY = 2000; // 2 seconds
+const AUDIT_BATCH_SIZE = 20;
+
+let pendingAuditEntries: AuditLogEntry[] = [];
+let auditFlushTimer: ReturnType<typeof setTimeout> | null = null;
+let auditAccessToken: string | null = null; // Current session token, readable synchronously on unload
+
+/**
+ * Maps an audit log entry to its database row
+ */
+function toAuditRow(entry: AuditLogEntry) {
+  return {
+    user_id: entry.user_id,
+    action: entry.action,
+    details: entry.details,
+    ip_address: entry.ip_address || null,
+    user_agent: entry.user_agent || null,
+  };
+}
+
 /**
  * Logs an audit event to the database
  * @param entry The audit log entry to record
  */
 export async function logAuditEvent(entry: AuditLogEntry): Promise<void> {
   try {
-    const { error } = await supabase.from('audit_logs').insert({
-      user_id: entry.user_id,
-      action: entry.action,
-      details: entry.details,
-      ip_address: entry.ip_address || null,
-      user_agent: entry.user_agent || null,
-    });
+    const { error } = await supabase.from('audit_logs').insert(toAuditRow(entry));
 
     if (error) {
       console.error('Failed to log audit event:', error);
@@ -53,6 +67,92 @@ export async function logAuditEvent(entry: AuditLogEntry): Promise<void> {
   }
 }
 
+/**
+ * Writes all queued audit events in a single insert
+ */
+export async function flushAuditEvents(): Promise<void> {
+  if (auditFlushTimer) {
+    clearTimeout(auditFlushTimer);
+    auditFlushTimer = null;
+  }
+
+  if (pendingAuditEntries.length === 0) {
+    return;
+  }
+
+  const entries = pendingAuditEntries;
+  pendingAuditEntries = [];
+
+  try {
+    const { error } = await supabase.from('audit_logs').insert(entries.map(toAuditRow));
+
+    if (!error) {
+      return;
+    }
+
+    console.error('Failed to log audit events, retrying individually:', error);
+  } catch (error) {
+    console.error('Audit logging error, retrying individually:', error);
+  }
+
+  // One bad row rejects the whole insert; write the entries one by one so the rest survive
+  await Promise.all(entries.map(logAuditEvent));
+}
+
+/**
+ * Writes queued audit events while the page is being unloaded
+ * A keepalive request outlives the page, where a supabase-js insert may be cancelled
+ */
+function flushAuditEventsOnUnload(): void {
+  if (auditFlushTimer) {
+    clearTimeout(auditFlushTimer);
+    auditFlushTimer = null;
+  }
+
+  if (pendingAuditEntries.length === 0) {
+    return;
+  }
+
+  const entries = pendingAuditEntries;
+  pendingAuditEntries = [];
+
+  fetch(`${supabaseUrl}/rest/v1/audit_logs`, {
+    method: 'POST',
+    keepalive: true,
+    headers: {
+      apikey: supabaseAnonKey,
+      Authorization: `Bearer ${auditAccessToken || supabaseAnonKey}`,
+      'Content-Type': 'application/json',
+      Prefer: 'return=minimal',
+    },
+    body: JSON.stringify(entries.map(toAuditRow)),
+  }).catch((error) => {
+    console.error('Audit logging error:', error);
+  });
+}
+
+/**
+ * Queues an audit event; queued events are written together shortly after
+ */
+function queueAuditEvent(entry: AuditLogEntry): void {
+  pendingAuditEntries.push(entry);
+
+  if (pendingAuditEntries.length >= AUDIT_BATCH_SIZE) {
+    flushAuditEvents();
+  } else if (!auditFlushTimer) {
+    auditFlushTimer = setTimeout(flushAuditEvents, AUDIT_FLUSH_DELAY);
+  }
+}
+
+// Don't lose queued events when the page is closed
+if (typeof window !== 'undefined') {
+  supabase.auth.onAuthStateChange((_event, session) => {
+    auditAccessToken = session?.access_token ?? null;
+  });
+
+  window.addEventListener('pagehide', flushAuditEventsOnUnload);
+}
+
 /**
  * Gets the user's IP address (client-side approximation)
  */
@@ -71,13 +171,14 @@ function getUserAgent(): string {
 
 /**
  * Helper to create audit log entries with automatic IP and user agent
+ * Entries are batched rather than written one request at a time
  */
 export function createAuditLog(
   userId: string,
   action: AuditAction,
   details: Record<string, any> = {}
 ): void {
-  logAuditEvent({
+  queueAuditEvent({
     user_id: userId,
     action,
     details,
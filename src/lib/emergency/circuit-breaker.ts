@@ -63,6 +63,7 @@ class CircuitBreakerService {
   private triggerCounts: Map<string, number> = new Map();
   private lastTriggerTime: Map<string, number> = new Map();
   private iiflClient: IIFLClient | null = null;
+  private readonly SQUARE_OFF_CONCURRENCY = 5; // Square-off requests in flight at once
 
   private readonly DEFAULT_CONFIGS: Record<CircuitBreakerType, CircuitBreakerConfig> = {
     daily_loss: {
@@ -297,24 +298,36 @@ class CircuitBreakerService {
         return { success: true, positionsClosed: 0, errors: [] };
       }
 
-      // Square off each position
-      for (const position of positions) {
+      const squareOff = async (position: any) => {
         try {
           if (this.iiflClient) {
             await this.iiflClient.squareOffPosition(position.symbol, 'NSE');
-            positionsClosed++;
           } else {
             // Simulate square off
-            await supabase
+            const { error } = await supabase
               .from('portfolios')
               .update({ quantity: 0 })
               .eq('id', position.id);
-            positionsClosed++;
+
+            if (error) throw error;
           }
+          positionsClosed++;
         } catch (error: any) {
           errors.push(`Failed to square off ${position.symbol}: ${error.message}`);
         }
-      }
+      };
+
+      // Square off only this user's positions; a fixed pool of workers pulls from the list,
+      // so in-flight requests stay capped without a slow position holding up a whole batch
+      let next = 0;
+      const worker = async () => {
+        while (next < positions.length) {
+          await squareOff(positions[next++]);
+        }
+      };
+
+      const workerCount = Math.min(this.SQUARE_OFF_CONCURRENCY, positions.length);
+      await Promise.all(Array.from({ length: workerCount }, worker));
 
       // Suspend trading
       await this.suspendTrading(request.userId, request.reason);
@@ -366,44 +379,56 @@ class CircuitBreakerService {
    * Suspend trading for a user
    */
   async suspendTrading(userId: string, reason: string): Promise<void> {
-    await supabase
+    // Return the notification fields from the update to skip a second profile read
+    const { data: recipient } = await supabase
       .from('profiles')
       .update({
         trading_suspended: true,
         suspension_reason: reason,
         suspended_at: new Date().toISOString(),
       })
-      .eq('id', userId);
+      .eq('id', userId)
+      .select('notification_preferences, phone')
+      .maybeSingle();
 
-    await notificationService.send({
-      userId,
-      type: 'system_alert',
-      title: 'Trading Suspended',
-      message: `Trading has been suspended. Reason: ${reason}`,
-      priority: 'critical',
-    });
+    await notificationService.send(
+      {
+        userId,
+        type: 'system_alert',
+        title: 'Trading Suspended',
+        message: `Trading has been suspended. Reason: ${reason}`,
+        priority: 'critical',
+      },
+      recipient
+    );
   }
 
   /**
    * Resume trading for a user
    */
   async resumeTrading(userId: string): Promise<void> {
-    await supabase
+    // Return the notification fields from the update to skip a second profile read
+    const { data: recipient } = await supabase
       .from('profiles')
       .update({
         trading_suspended: false,
         suspension_reason: null,
         suspended_at: null,
       })
-      .eq('id', userId);
+      .eq('id', userId)
+      .select('notification_preferences, phone')
+      .maybeSingle();
 
-    await notificationService.send({
-      userId,
-      type: 'system_alert',
-      title: 'Trading Resumed',
-      message: 'Trading has been resumed. You can now place orders.',
-      priority: 'medium',
-    });
+    await notificationService.send(
+      {
+        userId,
+        type: 'system_alert',
+        title: 'Trading Resumed',
+        message: 'Trading has been resumed. You can now place orders.',
+        priority: 'medium',
+      },
+      recipient
+    );
   }
 
   /**
@@ -581,7 +606,7 @@ class CircuitBreakerService {
     switch (stepNumber) {
       case 1:
         // Check database
-        await supabase.from('profiles').select('count').limit(1);
+        await supabase.from('profiles').select('id', { head: true }).limit(1);
         break;
       case 2:
         // Verify APIs
@@ -0,0 +1,13 @@
+// =====================================================
+// CURRENCY FORMATTING
+// =====================================================
+
+// Built once; toLocaleString with options constructs a new formatter per call
+const inrFormatter = new Intl.NumberFormat('en-IN', { minimumFractionDigits: 2 });
+
+/**
+ * Format an amount as Indian rupees, e.g. ₹1,23,456.00
+ */
+export function formatINR(value: number): string {
+  return `₹${inrFormatter.format(value)}`;
+}
@@ -38,15 +38,26 @@ export interface TradingSession {
   nextSessionEnd?: Date;
 }
 
+interface QuoteSubscription {
+  symbol: string;
+  exchange: string;
+  // Replaced rather than mutated, so ticks can iterate it while callbacks come and go
+  callbacks: ReadonlyArray<(quote: MarketQuote) => void>;
+}
+
 // =====================================================
 // MARKET DATA MANAGER
 // =====================================================
 
 export class MarketDataManager {
   private iiflClient: IIFLClient | null = null;
-  private subscriptions: Map<string, Set<(quote: MarketQuote) => void>> = new Map();
+  private subscriptions: Map<string, QuoteSubscription> = new Map();
+  // Copy-on-write view of subscriptions, rebuilt only when a symbol is added or removed
+  private subscriptionSnapshot: ReadonlyArray<QuoteSubscription> = [];
   private priceCache: Map<string, MarketQuote> = new Map();
   private updateInterval: NodeJS.Timeout | null = null;
+  private updateInFlight = false; // Set while a tick is still fetching quotes
+  private readonly QUOTE_FETCH_CONCURRENCY = 10; // Quote requests in flight at once per tick
 
   constructor(iiflClient?: IIFLClient) {
     this.iiflClient = iiflClient || null;
@@ -66,22 +77,27 @@ export class MarketDataManager {
   /**
    * Get real-time quote for a symbol
    */
-  async getQuote(symbol: string, exchange: string = 'NSE'): Promise<MarketQuote | null> {
+  async getQuote(
+    symbol: string,
+    exchange: string = 'NSE',
+    now: number = Date.now()
+  ): Promise<MarketQuote | null> {
     try {
       // Check cache first
       const cacheKey = `${exchange}:${symbol}`;
       const cached = this.priceCache.get(cacheKey);
 
-      if (cached && Date.now() - cached.timestamp < 1000) {
+      if (cached && now - cached.timestamp < 1000) {
         // Return cached if less than 1 second old
         return cached;
       }
 
+      // Quotes are frozen so one cached object can be handed to every subscriber
       // Fetch from IIFL if available
       if (this.iiflClient) {
         const data = await this.iiflClient.getQuote(symbol, exchange);
 
-        const quote: MarketQuote = {
+        const quote: MarketQuote = Object.freeze({
           symbol,
           exchange,
           ltp: data.ltp,
@@ -93,14 +109,16 @@ export class MarketDataManager {
           change: data.change,
           changePercent: data.changePercent,
           timestamp: data.timestamp,
-        };
+        });
 
         this.priceCache.set(cacheKey, quote);
         return quote;
       }
 
-      // Mock data for development
-      return this.getMockQuote(symbol, exchange);
+      // Mock data for development, cached like live quotes so subscribers share one per tick
+      const quote: MarketQuote = Object.freeze(this.getMockQuote(symbol, exchange, now));
+      this.priceCache.set(cacheKey, quote);
+      return quote;
     } catch (error) {
       console.error('Failed to fetch quote:', error);
       return null;
@@ -117,11 +135,15 @@ export class MarketDataManager {
   ): () => void {
     const key = `${exchange}:${symbol}`;
 
-    if (!this.subscriptions.has(key)) {
-      this.subscriptions.set(key, new Set());
+    let subscription = this.subscriptions.get(key);
+
+    if (!subscription) {
+      subscription = { symbol, exchange, callbacks: [] };
+      this.subscriptions.set(key, subscription);
+      this.subscriptionSnapshot = [...this.subscriptionSnapshot, subscription];
     }
 
-    this.subscriptions.get(key)!.add(callback);
+    subscription.callbacks = [...subscription.callbacks, callback];
 
     // Start update loop if not already running
     if (!this.updateInterval) {
@@ -130,11 +152,17 @@ export class MarketDataManager {
 
     // Return unsubscribe function
     return () => {
-      const callbacks = this.subscriptions.get(key);
-      if (callbacks) {
-        callbacks.delete(callback);
-        if (callbacks.size === 0) {
+      const subscription = this.subscriptions.get(key);
+      if (subscription) {
+        const index = subscription.callbacks.indexOf(callback);
+        if (index !== -1) {
+          subscription.callbacks = subscription.callbacks.filter((_, i) => i !== index);
+        }
+        if (subscription.callbacks.length === 0) {
           this.subscriptions.delete(key);
+          this.subscriptionSnapshot = this.subscriptionSnapshot.filter(
+            (entry) => entry !== subscription
+          );
         }
       }
 
@@ -151,19 +179,40 @@ export class MarketDataManager {
    */
   private startUpdateLoop(): void {
     this.updateInterval = setInterval(async () => {
-      for (const [key, callbacks] of this.subscriptions.entries()) {
-        const [exchange, symbol] = key.split(':');
-        const quote = await this.getQuote(symbol, exchange);
-
-        if (quote) {
-          callbacks.forEach((callback) => {
-            try {
-              callback(quote);
-            } catch (error) {
-              console.error('Error in quote callback:', error);
-            }
-          });
-        }
+      // Coalesce ticks: skip this one if the previous fetch has not finished,
+      // so subscribers only ever receive the latest quotes
+      if (this.updateInFlight) return;
+      this.updateInFlight = true;
+
+      try {
+        // Read the clock once per tick and share it across every symbol
+        const subscriptions = this.subscriptionSnapshot;
+        const now = Date.now();
+
+        // A fixed pool of workers pulls symbols from the snapshot, bounding in-flight quote
+        // requests; each quote is fanned out as soon as it arrives, without further awaits
+        let next = 0;
+        const worker = async () => {
+          while (next < subscriptions.length) {
+            const subscription = subscriptions[next++];
+            const quote = await this.getQuote(subscription.symbol, subscription.exchange, now);
+            if (!quote) continue;
+
+            // Iterate the immutable callback array; callbacks may unsubscribe mid-dispatch
+            subscription.callbacks.forEach((callback) => {
+              try {
+                callback(quote);
+              } catch (error) {
+                console.error('Error in quote callback:', error);
+              }
+            });
+          }
+        };
+
+        const workerCount = Math.min(this.QUOTE_FETCH_CONCURRENCY, subscriptions.length);
+        await Promise.all(Array.from({ length: workerCount }, worker));
+      } finally {
+        this.updateInFlight = false;
       }
     }, 1000); // Update every second
   }
@@ -255,7 +304,7 @@ export class MarketDataManager {
       // Get user's positions
       const { data: positions } = await supabase
         .from('portfolios')
-        .select('*')
+        .select('symbol')
         .eq('user_id', userId)
         .gt('quantity', 0);
 
@@ -263,44 +312,28 @@ export class MarketDataManager {
         return;
       }
 
-      // Fetch current prices
-      const symbols = positions.map((p) => ({ symbol: p.symbol, exchange: 'NSE' }));
+      // Fetch current prices once per symbol; a symbol can be held under several strategies
+      const symbols = Array.from(new Set(positions.map((p) => p.symbol)), (symbol) => ({
+        symbol,
+        exchange: 'NSE',
+      }));
       const quotes = await this.getBatchQuotes(symbols);
+      const updatedAt = new Date().toISOString();
 
-      // Update each position
-      const updates = positions.map(async (position) => {
-        const quote = quotes.find((q) => q.symbol === position.symbol);
-
-        if (!quote) return;
-
-        const currentPrice = quote.ltp;
-        const unrealizedPnL = (currentPrice - position.average_price) * position.quantity;
-
-        await supabase
-          .from('portfolios')
-          .update({
-            current_price: currentPrice,
-            unrealized_pnl: unrealizedPnL,
-            last_updated_at: new Date().toISOString(),
-          })
-          .eq('id', position.id);
+      // Reprice every position in one statement; the database sums the resulting P&L
+      const { data: totalUnrealizedPnL, error } = await supabase.rpc('apply_portfolio_prices', {
+        p_user_id: userId,
+        p_prices: Object.fromEntries(quotes.map((q) => [q.symbol, q.ltp])),
       });
 
-      await Promise.all(updates);
-
-      // Update account balance
-      const totalUnrealizedPnL = positions.reduce((sum, p) => {
-        const quote = quotes.find((q) => q.symbol === p.symbol);
-        if (!quote) return sum;
-        return sum + (quote.ltp - p.average_price) * p.quantity;
-      }, 0);
+      if (error) throw error;
 
       await supabase
         .from('account_balances')
         .update({
           unrealized_pnl: totalUnrealizedPnL,
           total_pnl: totalUnrealizedPnL, // Will be updated with realized P&L separately
-          last_synced_at: new Date().toISOString(),
+          last_synced_at: updatedAt,
         })
         .eq('user_id', userId);
     } catch (error) {
@@ -327,7 +360,7 @@ export class MarketDataManager {
     return date;
   }
 
-  private getMockQuote(symbol: string, exchange: string): MarketQuote {
+  private getMockQuote(symbol: string, exchange: string, now: number = Date.now()): MarketQuote {
     // Generate mock data for development
     const basePrice = 1000 + Math.random() * 1000;
     const change = (Math.random() - 0.5) * 50;
@@ -343,7 +376,7 @@ export class MarketDataManager {
       volume: Math.floor(Math.random() * 1000000),
       change,
       changePercent: (change / basePrice) * 100,
-      timestamp: Date.now(),
+      timestamp: now,
     };
   }
 
@@ -361,6 +394,7 @@ export class MarketDataManager {
     }
 
     this.subscriptions.clear();
+    this.subscriptionSnapshot = [];
     this.priceCache.clear();
   }
 }
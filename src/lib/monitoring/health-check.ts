@@ -72,7 +72,7 @@ export interface AlertRule {
 
 class HealthCheckService {
   private startTime: number = Date.now();
-  private metrics: Map<string, number[]> = new Map();
+  private metrics: Map<string, Array<{ at: number; value: number }>> = new Map(); // Oldest first
   private readonly METRIC_WINDOW = 60000; // 1 minute
 
   /**
@@ -81,14 +81,14 @@ class HealthCheckService {
   async checkHealth(): Promise<HealthCheckResult> {
     const timestamp = new Date().toISOString();
 
-    // Run all health checks concurrently
+    // Run all health checks concurrently, stamped with this run's timestamp
     const [database, iiflAPI, razorpay, openai, storage, realtime] = await Promise.all([
-      this.checkDatabase(),
-      this.checkIIFLAPI(),
-      this.checkRazorpay(),
-      this.checkOpenAI(),
-      this.checkStorage(),
-      this.checkRealtime(),
+      this.checkDatabase(timestamp),
+      this.checkIIFLAPI(timestamp),
+      this.checkRazorpay(timestamp),
+      this.checkOpenAI(timestamp),
+      this.checkStorage(timestamp),
+      this.checkRealtime(timestamp),
     ]);
 
     // Calculate overall status
@@ -121,11 +121,12 @@ class HealthCheckService {
   /**
    * Check database health
    */
-  async checkDatabase(): Promise<ServiceHealth> {
+  async checkDatabase(checkedAt: string = new Date().toISOString()): Promise<ServiceHealth> {
     const startTime = performance.now();
 
     try {
-      const { error } = await supabase.from('profiles').select('count').limit(1);
+      // HEAD request: checks reachability without transferring any rows
+      const { error } = await supabase.from('profiles').select('id', { head: true }).limit(1);
 
       const latency = performance.now() - startTime;
 
@@ -133,7 +134,7 @@ class HealthCheckService {
         return {
           status: 'unhealthy',
           latency,
-          lastChecked: new Date().toISOString(),
+          lastChecked: checkedAt,
           error: error.message,
         };
       }
@@ -141,12 +142,12 @@ class HealthCheckService {
       return {
         status: latency < 100 ? 'healthy' : latency < 500 ? 'degraded' : 'unhealthy',
         latency,
-        lastChecked: new Date().toISOString(),
+        lastChecked: checkedAt,
       };
     } catch (error: any) {
       return {
         status: 'critical',
-        lastChecked: new Date().toISOString(),
+        lastChecked: checkedAt,
         error: error.message,
       };
     }
@@ -155,7 +156,7 @@ class HealthCheckService {
   /**
    * Check IIFL API health
    */
-  async checkIIFLAPI(): Promise<ServiceHealth> {
+  async checkIIFLAPI(checkedAt: string = new Date().toISOString()): Promise<ServiceHealth> {
     const startTime = performance.now();
 
     try {
@@ -164,7 +165,7 @@ class HealthCheckService {
       if (!apiUrl) {
         return {
           status: 'degraded',
-          lastChecked: new Date().toISOString(),
+          lastChecked: checkedAt,
           details: 'IIFL API not configured',
         };
       }
@@ -180,12 +181,12 @@ class HealthCheckService {
       return {
         status: response.status === 200 ? 'healthy' : 'degraded',
         latency,
-        lastChecked: new Date().toISOString(),
+        lastChecked: checkedAt,
       };
     } catch (error: any) {
       return {
         status: 'unhealthy',
-        lastChecked: new Date().toISOString(),
+        lastChecked: checkedAt,
         error: error.message,
       };
     }
@@ -194,7 +195,7 @@ class HealthCheckService {
   /**
    * Check Razorpay health
    */
-  async checkRazorpay(): Promise<ServiceHealth> {
+  async checkRazorpay(checkedAt: string = new Date().toISOString()): Promise<ServiceHealth> {
     const startTime = performance.now();
 
     try {
@@ -203,7 +204,7 @@ class HealthCheckService {
       if (!apiKey) {
         return {
           status: 'degraded',
-          lastChecked: new Date().toISOString(),
+          lastChecked: checkedAt,
           details: 'Razorpay not configured',
         };
       }
@@ -214,12 +215,12 @@ class HealthCheckService {
       return {
         status: 'healthy',
         latency,
-        lastChecked: new Date().toISOString(),
+        lastChecked: checkedAt,
       };
     } catch (error: any) {
       return {
         status: 'unhealthy',
-        lastChecked: new Date().toISOString(),
+        lastChecked: checkedAt,
         error: error.message,
       };
     }
@@ -228,7 +229,7 @@ class HealthCheckService {
   /**
    * Check OpenAI health
    */
-  async checkOpenAI(): Promise<ServiceHealth> {
+  async checkOpenAI(checkedAt: string = new Date().toISOString()): Promise<ServiceHealth> {
     const startTime = performance.now();
 
     try {
@@ -237,7 +238,7 @@ class HealthCheckService {
       if (!apiKey) {
         return {
           status: 'degraded',
-          lastChecked: new Date().toISOString(),
+          lastChecked: checkedAt,
           details: 'OpenAI not configured - using mock data',
         };
       }
@@ -247,12 +248,12 @@ class HealthCheckService {
       return {
         status: 'healthy',
         latency,
-        lastChecked: new Date().toISOString(),
+        lastChecked: checkedAt,
       };
     } catch (error: any) {
       return {
         status: 'unhealthy',
-        lastChecked: new Date().toISOString(),
+        lastChecked: checkedAt,
         error: error.message,
       };
     }
@@ -261,7 +262,7 @@ class HealthCheckService {
   /**
    * Check storage health
    */
-  async checkStorage(): Promise<ServiceHealth> {
+  async checkStorage(checkedAt: string = new Date().toISOString()): Promise<ServiceHealth> {
     const startTime = performance.now();
 
     try {
@@ -273,7 +274,7 @@ class HealthCheckService {
         return {
           status: 'unhealthy',
           latency,
-          lastChecked: new Date().toISOString(),
+          lastChecked: checkedAt,
           error: error.message,
         };
       }
@@ -281,13 +282,13 @@ class HealthCheckService {
       return {
         status: 'healthy',
         latency,
-        lastChecked: new Date().toISOString(),
+        lastChecked: checkedAt,
         details: `${data.length} buckets`,
       };
     } catch (error: any) {
       return {
         status: 'critical',
-        lastChecked: new Date().toISOString(),
+        lastChecked: checkedAt,
         error: error.message,
       };
     }
@@ -296,20 +297,20 @@ class HealthCheckService {
   /**
    * Check realtime health
    */
-  async checkRealtime(): Promise<ServiceHealth> {
+  async checkRealtime(checkedAt: string = new Date().toISOString()): Promise<ServiceHealth> {
     try {
       // Check if realtime is configured
       const channels = supabase.getChannels();
 
       return {
         status: 'healthy',
-        lastChecked: new Date().toISOString(),
+        lastChecked: checkedAt,
         details: `${channels.length} active channels`,
       };
     } catch (error: any) {
       return {
         status: 'unhealthy',
-        lastChecked: new Date().toISOString(),
+        lastChecked: checkedAt,
         error: error.message,
       };
     }
@@ -334,35 +335,38 @@ class HealthCheckService {
    * Get system metrics
    */
   async getSystemMetrics(): Promise<SystemMetrics> {
-    // Get recent metrics from database
-    const { data: recentOrders } = await supabase
+    // Count recent orders server-side instead of fetching the rows
+    const { count: recentOrders } = await supabase
       .from('orders')
-      .select('created_at')
+      .select('id', { count: 'exact', head: true })
       .gte('created_at', new Date(Date.now() - 60000).toISOString());
 
-    const ordersPerMinute = recentOrders?.length || 0;
+    const ordersPerMinute = recentOrders || 0;
+    const orderLatency = this.getAverageMetric('order_processing') || 0;
+    const apiLatency = this.getAverageMetric('api_response') || 0;
+    const errorRate = this.getAverageMetric('errors') || 0;
 
     return {
       orderLatency: {
         name: 'Order Latency',
-        value: this.getAverageMetric('order_processing') || 0,
+        value: orderLatency,
         unit: 'ms',
         threshold: 250,
-        status: this.getAverageMetric('order_processing') || 0 < 250 ? 'ok' : 'warning',
+        status: orderLatency < 250 ? 'ok' : 'warning',
       },
       apiLatency: {
         name: 'API Latency',
-        value: this.getAverageMetric('api_response') || 0,
+        value: apiLatency,
         unit: 'ms',
         threshold: 500,
-        status: this.getAverageMetric('api_response') || 0 < 500 ? 'ok' : 'warning',
+        status: apiLatency < 500 ? 'ok' : 'warning',
       },
       errorRate: {
         name: 'Error Rate',
-        value: this.getAverageMetric('errors') || 0,
+        value: errorRate,
         unit: '%',
         threshold: 5,
-        status: this.getAverageMetric('errors') || 0 < 5 ? 'ok' : 'critical',
+        status: errorRate < 5 ? 'ok' : 'critical',
       },
       activeUsers: {
         name: 'Active Users',
@@ -392,18 +396,33 @@ class HealthCheckService {
    * Track metric
    */
   trackMetric(name: string, value: number): void {
-    const metrics = this.metrics.get(name) || [];
+    let metrics = this.metrics.get(name);
+    if (!metrics) {
+      metrics = [];
+      this.metrics.set(name, metrics);
+    }
+
     const now = Date.now();
 
     // Add new metric
-    metrics.push(value);
+    metrics.push({ at: now, value });
 
-    // Remove old metrics outside window
-    const filtered = metrics.filter((_, index) => {
-      return now - (index * 1000) < this.METRIC_WINDOW;
-    });
+    this.pruneMetrics(metrics, now);
+  }
+
+  /**
+   * Remove metrics outside the window, in place
+   * Samples are appended in time order, so the stale ones are always at the front
+   */
+  private pruneMetrics(metrics: Array<{ at: number; value: number }>, now: number): void {
+    let stale = 0;
+    while (stale < metrics.length && now - metrics[stale].at >= this.METRIC_WINDOW) {
+      stale++;
+    }
 
-    this.metrics.set(name, filtered);
+    if (stale > 0) {
+      metrics.splice(0, stale);
+    }
   }
 
   /**
@@ -412,11 +431,15 @@ class HealthCheckService {
   private getAverageMetric(name: string): number | null {
     const metrics = this.metrics.get(name);
 
+    if (metrics) {
+      this.pruneMetrics(metrics, Date.now());
+    }
+
     if (!metrics || metrics.length === 0) {
       return null;
     }
 
-    const sum = metrics.reduce((acc, val) => acc + val, 0);
+    const sum = metrics.reduce((acc, metric) => acc + metric.value, 0);
     return sum / metrics.length;
   }
 
@@ -446,37 +469,31 @@ class HealthCheckService {
     avgOrderLatency: number;
     apiConnectionStatus: string;
   }> {
-    const { data: recentOrders } = await supabase
-      .from('orders')
-      .select('status, created_at, updated_at')
-      .gte('created_at', new Date(Date.now() - 3600000).toISOString()); // Last hour
-
-    const totalOrders = recentOrders?.length || 0;
-    const successOrders = recentOrders?.filter((o) => o.status === 'FILLED').length || 0;
-    const failedOrders = recentOrders?.filter((o) => o.status === 'REJECTED').length || 0;
+    // Counts are aggregated in the database so only one row crosses the wire
+    const { data } = await supabase.rpc('get_order_health_stats', {
+      p_since: new Date(Date.now() - 3600000).toISOString(), // Last hour
+    });
 
-    const avgLatency =
-      recentOrders?.reduce((sum, o) => {
-        const created = new Date(o.created_at).getTime();
-        const updated = new Date(o.updated_at).getTime();
-        return sum + (updated - created);
-      }, 0) / (totalOrders || 1);
+    const stats = data?.[0];
+    const totalOrders = stats?.total_orders || 0;
+    const successOrders = stats?.successful_orders || 0;
 
     return {
       orderSuccess: totalOrders > 0 ? (successOrders / totalOrders) * 100 : 0,
-      orderFailures: failedOrders,
-      avgOrderLatency: avgLatency,
+      orderFailures: stats?.failed_orders || 0,
+      avgOrderLatency: stats?.avg_latency_ms || 0,
       apiConnectionStatus: 'connected', // Implement actual connection check
     };
   }
 
   /**
    * Detect system issues automatically
+   * Pass an existing health check result to avoid probing every service again
    */
-  async detectIssues(): Promise<string[]> {
+  async detectIssues(health?: HealthCheckResult): Promise<string[]> {
     const issues: string[] = [];
 
-    const health = await this.checkHealth();
+    health = health ?? (await this.checkHealth());
 
     if (health.status === 'critical' || health.status === 'unhealthy') {
       issues.push(`System health is ${health.status}`);
@@ -516,12 +533,13 @@ class HealthCheckService {
     issues: string[];
     tradingSystem: any;
   }> {
-    const [health, metrics, issues, tradingSystem] = await Promise.all([
+    // Issues are derived from the same health check rather than a second round of probes
+    const [health, metrics, tradingSystem] = await Promise.all([
       this.checkHealth(),
       this.getSystemMetrics(),
-      this.detectIssues(),
       this.monitorTradingSystem(),
     ]);
+    const issues = await this.detectIssues(health);
 
     return {
       health,
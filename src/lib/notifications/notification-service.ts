@@ -1,5 +1,5 @@
 import { supabase } from '../supabase';
-import axios from 'axios';
+import axios, { AxiosInstance } from 'axios';
 
 // =====================================================
 // TYPES
@@ -79,6 +79,11 @@ export interface WhatsAppNotification {
   message: string;
 }
 
+interface RecipientProfile {
+  notification_preferences: NotificationPreferences | null;
+  phone: string | null;
+}
+
 // =====================================================
 // NOTIFICATION TEMPLATES
 // =====================================================
@@ -205,11 +210,36 @@ class NotificationService {
   private readonly TWILIO_WHATSAPP_NUMBER = import.meta.env.VITE_TWILIO_WHATSAPP_NUMBER;
   private readonly RESEND_API_KEY = import.meta.env.VITE_RESEND_API_KEY;
   private readonly FROM_EMAIL = import.meta.env.VITE_FROM_EMAIL || 'noreply@replicon.app';
+  private readonly BULK_SEND_CONCURRENCY = 20; // Notifications in flight at once during bulk sends
+
+  // One configured client per provider, reused for every message
+  private readonly twilioClient: AxiosInstance = axios.create({
+    baseURL: `https://api.twilio.com/2010-04-01/Accounts/${this.TWILIO_ACCOUNT_SID}`,
+    auth: {
+      username: this.TWILIO_ACCOUNT_SID,
+      password: this.TWILIO_AUTH_TOKEN,
+    },
+    headers: {
+      'Content-Type': 'application/x-www-form-urlencoded',
+    },
+  });
+  private readonly resendClient: AxiosInstance = axios.create({
+    baseURL: 'https://api.resend.com',
+    headers: {
+      Authorization: `Bearer ${this.RESEND_API_KEY}`,
+      'Content-Type': 'application/json',
+    },
+  });
 
   /**
    * Send notification through multiple channels
+   * renderEmailHTML lets bulk sends share one rendered email body between recipients
    */
-  async send(request: SendNotificationRequest): Promise<{
+  async send(
+    request: SendNotificationRequest,
+    recipient?: RecipientProfile | null,
+    renderEmailHTML: () => string = () => this.generateEmailHTML(request)
+  ): Promise<{
     success: boolean;
     deliveryStatus: Record<NotificationChannel, boolean>;
   }> {
@@ -218,8 +248,12 @@ class NotificationService {
       const priority = request.priority || template.priority || 'medium';
       const channels = request.channels || template.channels || ['in_app'];
 
+      // Load preferences and contact details with a single profile query
+      const profile =
+        recipient !== undefined ? recipient : await this.getRecipientProfile(request.userId);
+
       // Get user preferences
-      const preferences = await this.getUserPreferences(request.userId);
+      const preferences = this.getUserPreferences(request.userId, profile);
 
       // Filter channels based on user preferences
       const enabledChannels = channels.filter((channel) =>
@@ -227,7 +261,7 @@ class NotificationService {
       );
 
       // Get user contact info
-      const userInfo = await this.getUserContactInfo(request.userId);
+      const userInfo = await this.getUserContactInfo(profile);
 
       // Send through each enabled channel
       const deliveryStatus: Record<NotificationChannel, boolean> = {
@@ -251,7 +285,7 @@ class NotificationService {
                 success = await this.sendEmail({
                   to: userInfo.email,
                   subject: request.title,
-                  html: this.generateEmailHTML(request),
+                  html: renderEmailHTML(),
                   text: request.message,
                 });
               }
@@ -341,22 +375,13 @@ class NotificationService {
     }
 
     try {
-      const response = await axios.post(
-        'https://api.resend.com/emails',
-        {
-          from: this.FROM_EMAIL,
-          to: notification.to,
-          subject: notification.subject,
-          html: notification.html,
-          text: notification.text,
-        },
-        {
-          headers: {
-            Authorization: `Bearer ${this.RESEND_API_KEY}`,
-            'Content-Type': 'application/json',
-          },
-        }
-      );
+      const response = await this.resendClient.post('/emails', {
+        from: this.FROM_EMAIL,
+        to: notification.to,
+        subject: notification.subject,
+        html: notification.html,
+        text: notification.text,
+      });
 
       return response.status === 200;
     } catch (error) {
@@ -375,22 +400,13 @@ class NotificationService {
     }
 
     try {
-      const response = await axios.post(
-        `https://api.twilio.com/2010-04-01/Accounts/${this.TWILIO_ACCOUNT_SID}/Messages.json`,
+      const response = await this.twilioClient.post(
+        '/Messages.json',
         new URLSearchParams({
           To: notification.to,
           From: this.TWILIO_PHONE_NUMBER,
           Body: notification.message,
-        }),
-        {
-          auth: {
-            username: this.TWILIO_ACCOUNT_SID,
-            password: this.TWILIO_AUTH_TOKEN,
-          },
-          headers: {
-            'Content-Type': 'application/x-www-form-urlencoded',
-          },
-        }
+        })
       );
 
       return response.status === 201;
@@ -410,22 +426,13 @@ class NotificationService {
     }
 
     try {
-      const response = await axios.post(
-        `https://api.twilio.com/2010-04-01/Accounts/${this.TWILIO_ACCOUNT_SID}/Messages.json`,
+      const response = await this.twilioClient.post(
+        '/Messages.json',
         new URLSearchParams({
           To: `whatsapp:${notification.to}`,
           From: `whatsapp:${this.TWILIO_WHATSAPP_NUMBER}`,
           Body: notification.message,
-        }),
-        {
-          auth: {
-            username: this.TWILIO_ACCOUNT_SID,
-            password: this.TWILIO_AUTH_TOKEN,
-          },
-          headers: {
-            'Content-Type': 'application/x-www-form-urlencoded',
-          },
-        }
+        })
       );
 
       return response.status === 201;
@@ -436,16 +443,60 @@ class NotificationService {
   }
 
   /**
-   * Get user notification preferences
+   * Get the profile fields needed to deliver a notification
    */
-  private async getUserPreferences(userId: string): Promise<NotificationPreferences> {
+  private async getRecipientProfile(userId: string): Promise<RecipientProfile | null> {
     const { data, error } = await supabase
       .from('profiles')
-      .select('notification_preferences')
+      .select('notification_preferences, phone')
       .eq('id', userId)
       .single();
 
-    if (error || !data?.notification_preferences) {
+    if (error || !data) {
+      return null;
+    }
+
+    return data as RecipientProfile;
+  }
+
+  /**
+   * Get delivery profiles for many users in one query
+   */
+  private async getRecipientProfiles(userIds: string[]): Promise<Map<string, RecipientProfile>> {
+    const profiles = new Map<string, RecipientProfile>();
+    const uniqueIds = Array.from(new Set(userIds));
+
+    if (uniqueIds.length === 0) {
+      return profiles;
+    }
+
+    const { data, error } = await supabase
+      .from('profiles')
+      .select('id, notification_preferences, phone')
+      .in('id', uniqueIds);
+
+    if (error || !data) {
+      return profiles;
+    }
+
+    data.forEach((row) => {
+      profiles.set(row.id, {
+        notification_preferences: row.notification_preferences,
+        phone: row.phone,
+      });
+    });
+
+    return profiles;
+  }
+
+  /**
+   * Get user notification preferences
+   */
+  private getUserPreferences(
+    userId: string,
+    profile: RecipientProfile | null
+  ): NotificationPreferences {
+    if (!profile?.notification_preferences) {
       // Return default preferences
       return {
         userId,
@@ -462,26 +513,20 @@ class NotificationService {
       };
     }
 
-    return data.notification_preferences as NotificationPreferences;
+    return profile.notification_preferences;
   }
 
   /**
    * Get user contact information
    */
   private async getUserContactInfo(
-    userId: string
+    profile: RecipientProfile | null
   ): Promise<{ email?: string; phone?: string }> {
-    const { data: profile } = await supabase
-      .from('profiles')
-      .select('phone')
-      .eq('id', userId)
-      .single();
-
     const { data: authUser } = await supabase.auth.getUser();
 
     return {
       email: authUser.user?.email,
-      phone: profile?.phone,
+      phone: profile?.phone || undefined,
     };
   }
 
@@ -629,12 +674,11 @@ class NotificationService {
     preferences: Partial<NotificationPreferences>
   ): Promise<{ success: boolean; error?: string }> {
     try {
-      const { error } = await supabase
-        .from('profiles')
-        .update({
-          notification_preferences: preferences,
-        })
-        .eq('id', userId);
+      // Merge in the database so preferences that weren't passed aren't wiped out
+      const { error } = await supabase.rpc('merge_notification_preferences', {
+        p_user_id: userId,
+        p_preferences: preferences,
+      });
 
       if (error) {
         return { success: false, error: error.message };
@@ -722,8 +766,41 @@ class NotificationService {
    * Send bulk notifications
    */
   async sendBulk(requests: SendNotificationRequest[]): Promise<void> {
-    const promises = requests.map((request) => this.send(request));
-    await Promise.allSettled(promises);
+    // Load every recipient's profile up front instead of querying per notification
+    const profiles = await this.getRecipientProfiles(requests.map((r) => r.userId));
+
+    // The email body only depends on the content, so render it once per distinct message
+    const renderedEmails = new Map<string, string>();
+
+    const sendOne = (request: SendNotificationRequest) => {
+      const contentKey = JSON.stringify([
+        request.priority,
+        request.title,
+        request.message,
+        request.metadata,
+      ]);
+      const renderEmailHTML = () => {
+        let html = renderedEmails.get(contentKey);
+        if (html === undefined) {
+          html = this.generateEmailHTML(request);
+          renderedEmails.set(contentKey, html);
+        }
+        return html;
+      };
+
+      return this.send(request, profiles.get(request.userId) || null, renderEmailHTML);
+    };
+
+    // A fixed pool of workers pulls from the queue, bounding in-flight provider requests
+    let next = 0;
+    const worker = async () => {
+      while (next < requests.length) {
+        await sendOne(requests[next++]);
+      }
+    };
+
+    const workerCount = Math.min(this.BULK_SEND_CONCURRENCY, requests.length);
+    await Promise.allSettled(Array.from({ length: workerCount }, worker));
   }
 }
 
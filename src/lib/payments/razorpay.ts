@@ -61,19 +61,33 @@ export interface Payment {
 export class RazorpayClient {
   private config: RazorpayConfig;
   private baseURL: string = 'https://api.razorpay.com/v1';
+  private readonly requestHeaders: Record<string, string>; // Built from config once, sent on every request
+  private readonly encoder = new TextEncoder();
+  private webhookKey: { secret: string; key: Promise<CryptoKey> } | null = null; // Imported HMAC key for the last secret
 
   constructor(config: RazorpayConfig) {
     this.config = config;
+    this.requestHeaders = {
+      'Content-Type': 'application/json',
+      Authorization: this.createAuthHeader(),
+    };
   }
 
   /**
    * Create basic auth header
    */
-  private getAuthHeader(): string {
+  private createAuthHeader(): string {
     const credentials = `${this.config.keyId}:${this.config.keySecret}`;
     return `Basic ${btoa(credentials)}`;
   }
 
+  /**
+   * Convert rupees to whole paise (19.99 * 100 is 1998.9999999999998 in floating point)
+   */
+  private toPaise(amount: number): number {
+    return Math.round(amount * 100);
+  }
+
   /**
    * Make API request to Razorpay
    */
@@ -85,10 +99,7 @@ export class RazorpayClient {
     try {
       const response = await fetch(`${this.baseURL}${endpoint}`, {
         method,
-        headers: {
-          'Content-Type': 'application/json',
-          Authorization: this.getAuthHeader(),
-        },
+        headers: this.requestHeaders,
         body: body ? JSON.stringify(body) : undefined,
       });
 
@@ -113,7 +124,7 @@ export class RazorpayClient {
    */
   async createOrder(amount: number, currency: string = 'INR', receipt?: string): Promise<PaymentOrder> {
     const data = await this.makeRequest('/orders', 'POST', {
-      amount: amount * 100, // Convert to paise
+      amount: this.toPaise(amount),
       currency,
       receipt: receipt || `order_${Date.now()}`,
     });
@@ -151,7 +162,7 @@ export class RazorpayClient {
    */
   async capturePayment(paymentId: string, amount: number, currency: string = 'INR'): Promise<Payment> {
     const data = await this.makeRequest(`/payments/${paymentId}/capture`, 'POST', {
-      amount: amount * 100,
+      amount: this.toPaise(amount),
       currency,
     });
 
@@ -172,7 +183,7 @@ export class RazorpayClient {
   async refundPayment(paymentId: string, amount?: number): Promise<any> {
     const body: any = {};
     if (amount) {
-      body.amount = amount * 100; // Convert to paise
+      body.amount = this.toPaise(amount);
     }
 
     return await this.makeRequest(`/payments/${paymentId}/refund`, 'POST', body);
@@ -275,21 +286,52 @@ export class RazorpayClient {
 
   /**
    * Verify webhook signature
+   * HMAC-SHA256 runs in the platform's native Web Crypto implementation
    */
-  verifyWebhookSignature(
+  async verifyWebhookSignature(
     webhookBody: string,
     webhookSignature: string,
     webhookSecret: string
-  ): boolean {
-    // In a real implementation, use crypto to verify signature
-    // const expectedSignature = crypto
-    //   .createHmac('sha256', webhookSecret)
-    //   .update(webhookBody)
-    //   .digest('hex');
-    // return expectedSignature === webhookSignature;
-
-    // For now, placeholder
-    return true;
+  ): Promise<boolean> {
+    // Razorpay sends a hex-encoded SHA-256 HMAC (32 bytes)
+    if (!/^[0-9a-f]{64}$/i.test(webhookSignature)) {
+      return false;
+    }
+
+    const signature = new Uint8Array(32);
+    for (let i = 0; i < signature.length; i++) {
+      signature[i] = parseInt(webhookSignature.slice(i * 2, i * 2 + 2), 16);
+    }
+
+    const key = await this.getWebhookKey(webhookSecret);
+
+    // verify() recomputes and compares the MAC natively, in constant time
+    return crypto.subtle.verify('HMAC', key, signature, this.encoder.encode(webhookBody));
+  }
+
+  /**
+   * Get the HMAC key for a webhook secret, importing it only when the secret changes
+   */
+  private getWebhookKey(webhookSecret: string): Promise<CryptoKey> {
+    if (this.webhookKey?.secret !== webhookSecret) {
+      const key = crypto.subtle.importKey(
+        'raw',
+        this.encoder.encode(webhookSecret),
+        { name: 'HMAC', hash: 'SHA-256' },
+        false,
+        ['verify']
+      );
+      this.webhookKey = { secret: webhookSecret, key };
+
+      // Don't keep a failed import around for later webhooks
+      key.catch(() => {
+        if (this.webhookKey?.key === key) {
+          this.webhookKey = null;
+        }
+      });
+    }
+
+    return this.webhookKey!.key;
   }
 
   /**
@@ -393,24 +393,43 @@ class RealtimeService {
    * Unsubscribe from a specific channel
    */
   async unsubscribe(channelName: string): Promise<void> {
-    const channel = this.channels.get(channelName);
-
-    if (channel) {
-      await supabase.removeChannel(channel);
-      this.channels.delete(channelName);
+    if (await this.removeChannel(channelName)) {
       this.reconnectAttempts.delete(channelName);
       console.log(`Unsubscribed from ${channelName}`);
     }
   }
 
+  /**
+   * Tear down a channel but keep its reconnect bookkeeping
+   */
+  private async removeChannel(channelName: string): Promise<boolean> {
+    const channel = this.channels.get(channelName);
+
+    if (!channel) {
+      return false;
+    }
+
+    this.channels.delete(channelName);
+    await supabase.removeChannel(channel);
+    return true;
+  }
+
   /**
    * Unsubscribe from all channels
    */
   async unsubscribeAll(): Promise<void> {
-    const channelNames = Array.from(this.channels.keys());
+    // Detach every channel up front, then tear them down together and report failures once
+    const channels = Array.from(this.channels.values());
+    this.channels.clear();
+    this.reconnectAttempts.clear();
+
+    const results = await Promise.allSettled(
+      channels.map((channel) => supabase.removeChannel(channel))
+    );
+    const failed = results.filter((result) => result.status === 'rejected').length;
 
-    for (const channelName of channelNames) {
-      await this.unsubscribe(channelName);
+    if (failed > 0) {
+      console.error(`Failed to remove ${failed} of ${channels.length} channels`);
     }
 
     console.log('Unsubscribed from all channels');
@@ -450,8 +469,9 @@ class RealtimeService {
       `Reconnecting to ${channelName} in ${delay}ms (attempt ${attempts + 1}/${this.MAX_RECONNECT_ATTEMPTS})`
     );
 
+    // Only drop the channel here: unsubscribe() would reset the attempt count and retry forever
     setTimeout(async () => {
-      await this.unsubscribe(channelName);
+      await this.removeChannel(channelName);
       resubscribe();
     }, delay);
   }
@@ -1,7 +1,7 @@
 import { createClient } from '@supabase/supabase-js';
 
-const supabaseUrl = import.meta.env.VITE_SUPABASE_URL || '';
-const supabaseAnonKey = import.meta.env.VITE_SUPABASE_ANON_KEY || '';
+export const supabaseUrl = import.meta.env.VITE_SUPABASE_URL || '';
+export const supabaseAnonKey = import.meta.env.VITE_SUPABASE_ANON_KEY || '';
 
 if (!supabaseUrl || !supabaseAnonKey) {
   console.warn(
@@ -308,6 +308,40 @@ export interface Database {
         Args: { p_strategy_id: string };
         Returns: number;
       };
+      get_order_health_stats: {
+        Args: { p_since: string };
+        Returns: {
+          total_orders: number;
+          successful_orders: number;
+          failed_orders: number;
+          avg_latency_ms: number;
+        }[];
+      };
+      get_user_trade_pnl: {
+        Args: { p_user_id: string; p_since: string };
+        Returns: { trade_count: number; total_volume: number; net_pnl: number }[];
+      };
+      merge_notification_preferences: {
+        Args: { p_user_id: string; p_preferences: Json };
+        Returns: Json;
+      };
+      get_user_daily_trade_pnl: {
+        Args: { p_user_id: string; p_since: string };
+        Returns: { trade_date: string; trade_count: number; total_volume: number; net_pnl: number }[];
+      };
+      get_user_order_activity: {
+        Args: { p_user_id: string; p_start: string; p_end: string };
+        Returns: {
+          total_orders: number;
+          total_volume: number;
+          largest_order: number;
+          frequent_symbols: string[];
+        }[];
+      };
+      apply_portfolio_prices: {
+        Args: { p_user_id: string; p_prices: Json };
+        Returns: number;
+      };
     };
   };
 }
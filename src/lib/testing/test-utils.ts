@@ -1,4 +1,5 @@
 import { supabase } from '../supabase';
+import type { RealtimeChannel } from '@supabase/supabase-js';
 import { orderManager } from '../trading/order-manager';
 import { riskManager } from '../trading/risk-manager';
 import { performanceAnalytics } from '../analytics/performance';
@@ -75,18 +76,17 @@ class TestUtils {
 
   /**
    * Run a test suite
+   * Tests are independent, so they run concurrently; results keep declaration order
    */
   async runSuite(
     suiteName: string,
     tests: Record<string, () => Promise<void>>
   ): Promise<TestSuite> {
-    const results: TestResult[] = [];
     const startTime = performance.now();
 
-    for (const [testName, testFn] of Object.entries(tests)) {
-      const result = await this.runTest(testName, testFn);
-      results.push(result);
-    }
+    const results = await Promise.all(
+      Object.entries(tests).map(([testName, testFn]) => this.runTest(testName, testFn))
+    );
 
     const totalDuration = performance.now() - startTime;
     const passedTests = results.filter((r) => r.passed).length;
@@ -194,6 +194,29 @@ class TestUtils {
     }
   }
 
+  /**
+   * Subscribe to a realtime channel and resolve once the server confirms it
+   * Waits on the status callback instead of sleeping for a fixed interval
+   */
+  subscribeAndWait(channel: RealtimeChannel, timeoutMs: number = 5000): Promise<void> {
+    return new Promise((resolve, reject) => {
+      const timer = setTimeout(
+        () => reject(new Error(`Timed out subscribing to ${channel.topic}`)),
+        timeoutMs
+      );
+
+      channel.subscribe((status) => {
+        if (status === 'SUBSCRIBED') {
+          clearTimeout(timer);
+          resolve();
+        } else if (status === 'CHANNEL_ERROR' || status === 'TIMED_OUT') {
+          clearTimeout(timer);
+          reject(new Error(`Subscription to ${channel.topic} failed: ${status}`));
+        }
+      });
+    });
+  }
+
   /**
    * Get all test results
    */
@@ -246,12 +269,16 @@ class TestUtils {
   }
 }
 
+// One harness shared by every suite and benchmark, so all results land in one registry
+export const testUtils = new TestUtils();
+
 // =====================================================
 // INTEGRATION TEST SUITES
 // =====================================================
 
 export class IntegrationTests {
-  private utils = new TestUtils();
+  private utils = testUtils;
+  mockLatencyMs: number = 0; // Simulated broker latency; opt in for timing-sensitive runs
 
   /**
    * Test database connectivity
@@ -312,7 +339,9 @@ export class IntegrationTests {
           'Order Processing',
           async () => {
             // Simulate order processing
-            await new Promise((resolve) => setTimeout(resolve, 10));
+            if (this.mockLatencyMs > 0) {
+              await new Promise((resolve) => setTimeout(resolve, this.mockLatencyMs));
+            }
           },
           10
         );
@@ -370,7 +399,12 @@ export class IntegrationTests {
         // Test creating a subscription
         const channel = supabase.channel('test-channel');
         this.utils.assertDefined(channel, 'Channel should be created');
-        await supabase.removeChannel(channel);
+
+        try {
+          await this.utils.subscribeAndWait(channel);
+        } finally {
+          await supabase.removeChannel(channel);
+        }
       },
     });
   }
@@ -451,7 +485,7 @@ export class IntegrationTests {
 // =====================================================
 
 export class PerformanceBenchmarks {
-  private utils = new TestUtils();
+  private utils = testUtils;
 
   /**
    * Benchmark order processing latency
@@ -488,8 +522,12 @@ export class PerformanceBenchmarks {
       'Realtime Subscribe/Unsubscribe',
       async () => {
         const channel = supabase.channel(`test-${Date.now()}`);
-        channel.subscribe();
-        await supabase.removeChannel(channel);
+
+        try {
+          await this.utils.subscribeAndWait(channel);
+        } finally {
+          await supabase.removeChannel(channel);
+        }
       },
       20
     );
@@ -532,10 +570,17 @@ export class LoadTesting {
     errors: string[];
   }> {
     const startTime = performance.now();
+    const latencies: number[] = [];
     const results = await Promise.allSettled(
-      Array(userCount)
-        .fill(null)
-        .map(() => operation())
+      Array.from({ length: userCount }, async () => {
+        // Time each operation itself; wall time / count understates latency under concurrency
+        const operationStart = performance.now();
+        try {
+          await operation();
+        } finally {
+          latencies.push(performance.now() - operationStart);
+        }
+      })
     );
 
     const totalTime = performance.now() - startTime;
@@ -547,7 +592,7 @@ export class LoadTesting {
 
     return {
       totalTime,
-      avgTime: totalTime / userCount,
+      avgTime: latencies.reduce((sum, t) => sum + t, 0) / (latencies.length || 1),
       successCount,
       errorCount,
       errors,
@@ -579,11 +624,11 @@ export class LoadTesting {
   async stressTest(duration: number = 60000): Promise<void> {
     console.log(`\nRunning stress test for ${duration / 1000} seconds...`);
 
-    const startTime = Date.now();
+    const startTime = performance.now();
     let requestCount = 0;
     let errorCount = 0;
 
-    while (Date.now() - startTime < duration) {
+    while (performance.now() - startTime < duration) {
       try {
         await supabase.from('profiles').select('count').limit(1);
         requestCount++;
@@ -595,7 +640,7 @@ export class LoadTesting {
       await new Promise((resolve) => setTimeout(resolve, 10));
     }
 
-    const totalTime = Date.now() - startTime;
+    const totalTime = performance.now() - startTime;
     const requestsPerSecond = (requestCount / totalTime) * 1000;
 
     console.log(`Total Requests: ${requestCount}`);
@@ -606,7 +651,6 @@ export class LoadTesting {
 }
 
 // Export singleton instances
-export const testUtils = new TestUtils();
 export const integrationTests = new IntegrationTests();
 export const performanceBenchmarks = new PerformanceBenchmarks();
 export const loadTesting = new LoadTesting();
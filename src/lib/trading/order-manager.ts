@@ -37,12 +37,53 @@ export interface FollowerOrder extends OrderInput {
   scalingFactor: number;
 }
 
+export interface OrderCursor {
+  createdAt: string;
+  id: string;
+}
+
+// Order statuses that can still be cancelled
+const CANCELLABLE_STATUSES = ['pending', 'submitted', 'partially_filled'];
+
+// IIFL order status to the orders.status enum; the broker's string is never stored as-is
+const ORDER_STATUS_FROM_BROKER: Record<IIFLOrderResponse['status'], string> = {
+  PENDING: 'pending',
+  SUBMITTED: 'submitted',
+  FILLED: 'filled',
+  REJECTED: 'rejected',
+  CANCELLED: 'cancelled',
+};
+
+// Fields every IIFL order request shares; only the order-specific fields vary per call
+const IIFL_ORDER_DEFAULTS: Readonly<Pick<IIFLOrderRequest, 'exchange' | 'productType' | 'validity'>> =
+  Object.freeze({
+    exchange: 'NSE', // Default to NSE, can be enhanced
+    productType: 'INTRADAY',
+    validity: 'DAY',
+  });
+
+// Internal order type to IIFL order type
+const IIFL_ORDER_TYPES: Record<OrderInput['orderType'], IIFLOrderRequest['orderType']> = {
+  market: 'MARKET',
+  limit: 'LIMIT',
+  stop_loss: 'SL',
+  stop_loss_market: 'SL-M',
+};
+
 // =====================================================
 // ORDER MANAGER CLASS
 // =====================================================
 
 export class OrderManager {
   private iiflClient: IIFLClient | null = null;
+  private strategyOrdersCache: Map<string, { expiresAt: number; orders: Promise<any[]> }> =
+    new Map();
+  private readonly STRATEGY_ORDERS_TTL = 5000; // 5 seconds
+  private readonly STRATEGY_ORDERS_CACHE_SIZE = 200; // Oldest entries are dropped past this
+  private masterRoleCache: Map<string, { expiresAt: number; isMaster: Promise<boolean> }> =
+    new Map();
+  private readonly MASTER_ROLE_TTL = 30000; // 30 seconds; bounds how long a role change goes unseen
+  private readonly MASTER_ROLE_CACHE_SIZE = 1000; // Oldest entries are dropped past this
 
   constructor(iiflClient?: IIFLClient) {
     this.iiflClient = iiflClient || null;
@@ -151,7 +192,20 @@ export class OrderManager {
         throw new Error(validation.error || 'Order validation failed');
       }
 
-      // Create order record in database
+      // Execute order via IIFL first so the record is written once with its final status
+      let brokerResponse: IIFLOrderResponse | null = null;
+      let brokerError: string | null = null;
+
+      if (this.iiflClient) {
+        try {
+          const iiflOrder: IIFLOrderRequest = this.convertToIIFLOrder(order);
+          brokerResponse = await this.iiflClient.placeOrder(iiflOrder);
+        } catch (error) {
+          brokerError = error instanceof Error ? error.message : 'Broker order placement failed';
+        }
+      }
+
+      // Create order record in database (mock execution marks it submitted)
       const { data: dbOrder, error: dbError } = await supabase
         .from('orders')
         .insert({
@@ -163,40 +217,38 @@ export class OrderManager {
           quantity: order.quantity,
           price: order.price,
           trigger_price: order.triggerPrice,
-          status: 'pending',
+          status: brokerError
+            ? 'rejected'
+            : (brokerResponse && ORDER_STATUS_FROM_BROKER[brokerResponse.status]) || 'submitted',
+          broker_order_id: brokerResponse?.orderId,
+          rejection_reason: brokerError,
+          submitted_at: brokerError ? null : new Date().toISOString(),
         })
-        .select()
+        .select('id')
         .single();
 
       if (dbError || !dbOrder) {
+        if (brokerResponse) {
+          // The order is live at the broker; surface its ID instead of reporting a rejection
+          console.error(
+            `Broker order ${brokerResponse.orderId} was placed but its order record could not be saved:`,
+            dbError
+          );
+
+          return {
+            orderId: '',
+            status: brokerResponse.status,
+            message: `Order placed with broker (${brokerResponse.orderId}) but the order record could not be saved`,
+            brokerOrderId: brokerResponse.orderId,
+            executionTime: performance.now() - startTime,
+          };
+        }
+
         throw new Error('Failed to create order record');
       }
 
-      // Execute order via IIFL if client is available
-      let brokerResponse: IIFLOrderResponse | null = null;
-
-      if (this.iiflClient) {
-        const iiflOrder: IIFLOrderRequest = this.convertToIIFLOrder(order);
-        brokerResponse = await this.iiflClient.placeOrder(iiflOrder);
-
-        // Update order with broker details
-        await supabase
-          .from('orders')
-          .update({
-            status: brokerResponse.status.toLowerCase(),
-            broker_order_id: brokerResponse.orderId,
-            submitted_at: new Date().toISOString(),
-          })
-          .eq('id', dbOrder.id);
-      } else {
-        // Mock execution for development
-        await supabase
-          .from('orders')
-          .update({
-            status: 'submitted',
-            submitted_at: new Date().toISOString(),
-          })
-          .eq('id', dbOrder.id);
+      if (brokerError) {
+        throw new Error(brokerError);
       }
 
       const executionTime = performance.now() - startTime;
@@ -204,6 +256,7 @@ export class OrderManager {
       // Copy order to followers if this is a master order
       if (order.strategyId) {
         await this.copyOrderToFollowers(dbOrder.id, order);
+        this.invalidateStrategyOrders(order.strategyId);
       }
 
       return {
@@ -230,36 +283,16 @@ export class OrderManager {
    */
   private convertToIIFLOrder(order: OrderInput): IIFLOrderRequest {
     return {
-      exchange: 'NSE', // Default to NSE, can be enhanced
+      ...IIFL_ORDER_DEFAULTS,
       symbol: order.symbol,
-      side: order.side.toUpperCase() as 'BUY' | 'SELL',
-      orderType: this.mapOrderType(order.orderType),
+      side: order.side === 'buy' ? 'BUY' : 'SELL',
+      orderType: IIFL_ORDER_TYPES[order.orderType] ?? 'MARKET',
       quantity: order.quantity,
       price: order.price,
       triggerPrice: order.triggerPrice,
-      productType: 'INTRADAY',
-      validity: 'DAY',
     };
   }
 
-  /**
-   * Map order type to IIFL format
-   */
-  private mapOrderType(type: string): 'MARKET' | 'LIMIT' | 'SL' | 'SL-M' {
-    switch (type) {
-      case 'market':
-        return 'MARKET';
-      case 'limit':
-        return 'LIMIT';
-      case 'stop_loss':
-        return 'SL';
-      case 'stop_loss_market':
-        return 'SL-M';
-      default:
-        return 'MARKET';
-    }
-  }
-
   // =====================================================
   // FOLLOWER ORDER PROCESSING
   // =====================================================
@@ -269,14 +302,7 @@ export class OrderManager {
    */
   private async copyOrderToFollowers(masterOrderId: string, masterOrder: OrderInput): Promise<void> {
     try {
-      // Get user role
-      const { data: profile } = await supabase
-        .from('profiles')
-        .select('role')
-        .eq('id', masterOrder.userId)
-        .single();
-
-      if (!profile || profile.role !== 'master') {
+      if (!(await this.isMaster(masterOrder.userId))) {
         return; // Not a master order
       }
 
@@ -291,64 +317,30 @@ export class OrderManager {
         return;
       }
 
-      // Process each follower order concurrently
-      const followerOrders = subscriptions.map((subscription) => {
-        const scaledQuantity = calculateScaledQuantity(
-          masterOrder.quantity,
-          subscription.scaling_factor
-        );
-
-        const followerOrder: OrderInput = {
-          ...masterOrder,
-          userId: subscription.follower_id,
-          quantity: scaledQuantity,
-        };
-
-        return this.processFollowerOrder(followerOrder, masterOrderId);
-      });
-
-      await Promise.allSettled(followerOrders);
-    } catch (error) {
-      console.error('Failed to copy orders to followers:', error);
-    }
-  }
-
-  /**
-   * Process a single follower order
-   */
-  private async processFollowerOrder(
-    order: OrderInput,
-    parentOrderId: string
-  ): Promise<void> {
-    try {
-      // Create follower order with reference to parent
-      const { data: dbOrder } = await supabase
-        .from('orders')
-        .insert({
-          user_id: order.userId,
-          strategy_id: order.strategyId,
-          parent_order_id: parentOrderId,
-          order_type: order.orderType,
-          side: order.side,
-          symbol: order.symbol,
-          quantity: order.quantity,
-          price: order.price,
-          trigger_price: order.triggerPrice,
-          status: 'pending',
-        })
-        .select()
-        .single();
-
-      if (dbOrder) {
-        // Execute follower order asynchronously
-        // In production, this would use the follower's IIFL client
-        await supabase
-          .from('orders')
-          .update({ status: 'submitted', submitted_at: new Date().toISOString() })
-          .eq('id', dbOrder.id);
+      // Build every follower order and write them in a single insert
+      // In production, each order would be executed with the follower's IIFL client
+      const submittedAt = new Date().toISOString();
+      const followerOrders = subscriptions.map((subscription) => ({
+        user_id: subscription.follower_id,
+        strategy_id: masterOrder.strategyId,
+        parent_order_id: masterOrderId,
+        order_type: masterOrder.orderType,
+        side: masterOrder.side,
+        symbol: masterOrder.symbol,
+        quantity: calculateScaledQuantity(masterOrder.quantity, subscription.scaling_factor),
+        price: masterOrder.price,
+        trigger_price: masterOrder.triggerPrice,
+        status: 'submitted',
+        submitted_at: submittedAt,
+      }));
+
+      const { error } = await supabase.from('orders').insert(followerOrders);
+
+      if (error) {
+        console.error('Failed to create follower orders:', error);
       }
     } catch (error) {
-      console.error('Failed to process follower order:', error);
+      console.error('Failed to copy orders to followers:', error);
     }
   }
 
@@ -366,23 +358,8 @@ export class OrderManager {
     const startTime = performance.now();
 
     try {
-      // Get existing order
-      const { data: existingOrder } = await supabase
-        .from('orders')
-        .select('*')
-        .eq('id', orderId)
-        .single();
-
-      if (!existingOrder) {
-        throw new Error('Order not found');
-      }
-
-      if (existingOrder.status !== 'pending' && existingOrder.status !== 'submitted') {
-        throw new Error('Cannot modify order in current status');
-      }
-
-      // Update database
-      const { error: updateError } = await supabase
+      // Update database, only while the order is still open
+      const { data: existingOrder, error: updateError } = await supabase
         .from('orders')
         .update({
           quantity: modifications.quantity,
@@ -390,12 +367,29 @@ export class OrderManager {
           trigger_price: modifications.triggerPrice,
           updated_at: new Date().toISOString(),
         })
-        .eq('id', orderId);
+        .eq('id', orderId)
+        .in('status', ['pending', 'submitted'])
+        .select('strategy_id, broker_order_id')
+        .maybeSingle();
 
       if (updateError) {
         throw new Error('Failed to update order');
       }
 
+      if (!existingOrder) {
+        // Nothing matched: find out whether the order is missing or just closed
+        const { count } = await supabase
+          .from('orders')
+          .select('id', { count: 'exact', head: true })
+          .eq('id', orderId);
+
+        throw new Error(count ? 'Cannot modify order in current status' : 'Order not found');
+      }
+
+      if (existingOrder.strategy_id) {
+        this.invalidateStrategyOrders(existingOrder.strategy_id);
+      }
+
       // Modify via broker if available
       if (this.iiflClient && existingOrder.broker_order_id) {
         await this.iiflClient.modifyOrder(existingOrder.broker_order_id, modifications as any);
@@ -431,7 +425,7 @@ export class OrderManager {
       // Get existing order
       const { data: existingOrder } = await supabase
         .from('orders')
-        .select('*')
+        .select('status, strategy_id, broker_order_id')
         .eq('id', orderId)
         .single();
 
@@ -439,16 +433,34 @@ export class OrderManager {
         throw new Error('Order not found');
       }
 
+      if (!CANCELLABLE_STATUSES.includes(existingOrder.status)) {
+        throw new Error('Cannot cancel order in current status');
+      }
+
       // Cancel via broker if available
       if (this.iiflClient && existingOrder.broker_order_id) {
         await this.iiflClient.cancelOrder(existingOrder.broker_order_id);
       }
 
-      // Update database
-      await supabase
+      // Update database; the status guard keeps a fill that landed meanwhile from being overwritten
+      const { data: cancelledRows, error: updateError } = await supabase
         .from('orders')
         .update({ status: 'cancelled' })
-        .eq('id', orderId);
+        .eq('id', orderId)
+        .in('status', CANCELLABLE_STATUSES)
+        .select('id');
+
+      if (existingOrder.strategy_id) {
+        this.invalidateStrategyOrders(existingOrder.strategy_id);
+      }
+
+      if (updateError) {
+        throw new Error('Failed to update order status');
+      }
+
+      if (!cancelledRows || cancelledRows.length === 0) {
+        throw new Error('Order is no longer cancellable');
+      }
 
       const executionTime = performance.now() - startTime;
 
@@ -493,13 +505,23 @@ export class OrderManager {
 
   /**
    * Get user's orders
+   * Pages by (created_at, id) keyset; pass the last row of a page as `before` to get the next one
    */
-  async getUserOrders(userId: string, limit: number = 50) {
-    const { data, error } = await supabase
+  async getUserOrders(userId: string, limit: number = 50, before?: OrderCursor) {
+    let query = supabase
       .from('orders')
       .select('*')
-      .eq('user_id', userId)
+      .eq('user_id', userId);
+
+    if (before) {
+      query = query.or(
+        `created_at.lt."${before.createdAt}",and(created_at.eq."${before.createdAt}",id.lt.${before.id})`
+      );
+    }
+
+    const { data, error } = await query
       .order('created_at', { ascending: false })
+      .order('id', { ascending: false })
       .limit(limit);
 
     if (error) {
@@ -509,10 +531,127 @@ export class OrderManager {
     return data || [];
   }
 
+  /**
+   * Iterate over all of a user's orders, newest first, one keyset page at a time
+   * Use for exports so the full history never has to be held in memory at once
+   */
+  async *iterateUserOrders(userId: string, pageSize: number = 500): AsyncGenerator<any> {
+    let before: OrderCursor | undefined;
+
+    while (true) {
+      const page = await this.getUserOrders(userId, pageSize, before);
+
+      for (const order of page) {
+        yield order;
+      }
+
+      if (page.length < pageSize) {
+        return;
+      }
+
+      const last = page[page.length - 1];
+      before = { createdAt: last.created_at, id: last.id };
+    }
+  }
+
   /**
    * Get strategy orders
+   * Results are cached briefly and concurrent callers share one in-flight request
+   */
+  async getStrategyOrders(strategyId: string, limit: number = 50): Promise<any[]> {
+    const cacheKey = `${strategyId}:${limit}`;
+    const cached = this.strategyOrdersCache.get(cacheKey);
+    const now = Date.now();
+
+    if (cached && now < cached.expiresAt) {
+      return cached.orders;
+    }
+
+    const orders = this.fetchStrategyOrders(strategyId, limit);
+
+    // Re-insert so Map order tracks recency, then evict the oldest (often long expired) entry
+    this.strategyOrdersCache.delete(cacheKey);
+    this.strategyOrdersCache.set(cacheKey, {
+      expiresAt: now + this.STRATEGY_ORDERS_TTL,
+      orders,
+    });
+    if (this.strategyOrdersCache.size > this.STRATEGY_ORDERS_CACHE_SIZE) {
+      this.strategyOrdersCache.delete(this.strategyOrdersCache.keys().next().value!);
+    }
+
+    // Don't keep failed lookups around
+    orders.catch(() => {
+      if (this.strategyOrdersCache.get(cacheKey)?.orders === orders) {
+        this.strategyOrdersCache.delete(cacheKey);
+      }
+    });
+
+    return orders;
+  }
+
+  /**
+   * Drop cached order lists for a strategy after its orders change
+   */
+  private invalidateStrategyOrders(strategyId: string): void {
+    for (const key of this.strategyOrdersCache.keys()) {
+      if (key.startsWith(`${strategyId}:`)) {
+        this.strategyOrdersCache.delete(key);
+      }
+    }
+  }
+
+  /**
+   * Check whether a user is a master
+   * Roles rarely change, so the lookup is cached briefly per user and shared by concurrent callers
+   */
+  private isMaster(userId: string): Promise<boolean> {
+    const cached = this.masterRoleCache.get(userId);
+    const now = Date.now();
+
+    if (cached && now < cached.expiresAt) {
+      return cached.isMaster;
+    }
+
+    const isMaster = this.fetchIsMaster(userId);
+    const entry = { expiresAt: now + this.MASTER_ROLE_TTL, isMaster };
+
+    this.masterRoleCache.delete(userId);
+    this.masterRoleCache.set(userId, entry);
+    if (this.masterRoleCache.size > this.MASTER_ROLE_CACHE_SIZE) {
+      this.masterRoleCache.delete(this.masterRoleCache.keys().next().value!);
+    }
+
+    // Don't keep failed lookups around
+    isMaster.catch(() => {
+      if (this.masterRoleCache.get(userId) === entry) {
+        this.masterRoleCache.delete(userId);
+      }
+    });
+
+    return isMaster;
+  }
+
+  /**
+   * Check the user is a master without fetching the profile row
+   */
+  private async fetchIsMaster(userId: string): Promise<boolean> {
+    const { count, error } = await supabase
+      .from('profiles')
+      .select('id', { count: 'exact', head: true })
+      .eq('id', userId)
+      .eq('role', 'master');
+
+    if (error) {
+      throw new Error('Failed to fetch user role');
+    }
+
+    return !!count;
+  }
+
+  /**
+   * Fetch strategy orders from the database
    */
-  async getStrategyOrders(strategyId: string, limit: number = 50) {
+  private async fetchStrategyOrders(strategyId: string, limit: number): Promise<any[]> {
     const { data, error } = await supabase
       .from('orders')
       .select('*')
@@ -130,27 +130,26 @@ export class RiskManager {
    */
   async calculateRiskMetrics(userId: string): Promise<RiskMetrics> {
     try {
-      // Get account balance
-      const { data: balance } = await supabase
-        .from('account_balances')
-        .select('*')
-        .eq('user_id', userId)
-        .single();
-
-      // Get open positions
-      const { data: positions } = await supabase
-        .from('portfolios')
-        .select('*')
-        .eq('user_id', userId)
-        .gt('quantity', 0);
-
-      // Get today's trades for P&L calculation
       const today = new Date().toISOString().split('T')[0];
-      const { data: todayTrades } = await supabase
-        .from('trades')
-        .select('total_value, side, commission, tax')
-        .eq('user_id', userId)
-        .gte('executed_at', today);
+
+      // Balance, open positions and today's trade P&L are independent, so fetch them together
+      const [{ data: balance }, { data: positions }, { data: todayPnL }] = await Promise.all([
+        supabase
+          .from('account_balances')
+          .select('total_balance')
+          .eq('user_id', userId)
+          .single(),
+        supabase
+          .from('portfolios')
+          .select('quantity, current_price, average_price')
+          .eq('user_id', userId)
+          .gt('quantity', 0),
+        // Today's trade P&L is aggregated in the database
+        supabase.rpc('get_user_trade_pnl', {
+          p_user_id: userId,
+          p_since: today,
+        }),
+      ]);
 
       // Calculate metrics
       const currentExposure = positions?.reduce(
@@ -158,10 +157,7 @@ export class RiskManager {
         0
       ) || 0;
 
-      const dailyPnL = todayTrades?.reduce((sum, trade) => {
-        const value = trade.total_value - trade.commission - trade.tax;
-        return sum + (trade.side === 'sell' ? value : -value);
-      }, 0) || 0;
+      const dailyPnL = todayPnL?.[0]?.net_pnl || 0;
 
       const totalBalance = balance?.total_balance || 0;
       const peakBalance = totalBalance + Math.max(0, -dailyPnL); // Estimate peak
@@ -292,45 +288,35 @@ export class RiskManager {
     return { pause: false };
   }
 
+  /**
+   * Get net trade P&L per day over the last `days` days, grouped in the database
+   */
+  private async getDailyPnL(userId: string, days: number): Promise<number[]> {
+    const since = new Date();
+    since.setDate(since.getDate() - days);
+
+    const { data, error } = await supabase.rpc('get_user_daily_trade_pnl', {
+      p_user_id: userId,
+      p_since: since.toISOString(),
+    });
+
+    if (error) throw error;
+
+    return (data || []).map((row: { net_pnl: number | string }) => Number(row.net_pnl));
+  }
+
   /**
    * Calculate Value at Risk (VaR) - simplified daily VaR
    */
   async calculateVaR(userId: string, confidenceLevel: number = 0.95): Promise<number> {
     try {
       // Get last 30 days of daily P&L
-      const thirtyDaysAgo = new Date();
-      thirtyDaysAgo.setDate(thirtyDaysAgo.getDate() - 30);
-
-      const { data: trades } = await supabase
-        .from('trades')
-        .select('executed_at, total_value, side, commission, tax')
-        .eq('user_id', userId)
-        .gte('executed_at', thirtyDaysAgo.toISOString());
+      const dailyPnL = await this.getDailyPnL(userId, 30);
 
-      if (!trades || trades.length === 0) {
+      if (dailyPnL.length === 0) {
         return 0;
       }
 
-      // Group by day and calculate daily P&L
-      const dailyPnL: number[] = [];
-      const tradesByDay = new Map<string, typeof trades>();
-
-      trades.forEach((trade) => {
-        const day = trade.executed_at.split('T')[0];
-        if (!tradesByDay.has(day)) {
-          tradesByDay.set(day, []);
-        }
-        tradesByDay.get(day)!.push(trade);
-      });
-
-      tradesByDay.forEach((dayTrades) => {
-        const pnl = dayTrades.reduce((sum, trade) => {
-          const value = trade.total_value - trade.commission - trade.tax;
-          return sum + (trade.side === 'sell' ? value : -value);
-        }, 0);
-        dailyPnL.push(pnl);
-      });
-
       // Sort returns
       dailyPnL.sort((a, b) => a - b);
 
@@ -348,40 +334,13 @@ export class RiskManager {
    */
   async calculateSharpeRatio(userId: string, riskFreeRate: number = 0.06): Promise<number> {
     try {
-      // Get last 90 days of trades
-      const ninetyDaysAgo = new Date();
-      ninetyDaysAgo.setDate(ninetyDaysAgo.getDate() - 90);
-
-      const { data: trades } = await supabase
-        .from('trades')
-        .select('executed_at, total_value, side, commission, tax')
-        .eq('user_id', userId)
-        .gte('executed_at', ninetyDaysAgo.toISOString());
+      // Get last 90 days of daily returns
+      const dailyReturns = await this.getDailyPnL(userId, 90);
 
-      if (!trades || trades.length === 0) {
+      if (dailyReturns.length === 0) {
         return 0;
       }
 
-      // Calculate daily returns
-      const dailyReturns: number[] = [];
-      const tradesByDay = new Map<string, typeof trades>();
-
-      trades.forEach((trade) => {
-        const day = trade.executed_at.split('T')[0];
-        if (!tradesByDay.has(day)) {
-          tradesByDay.set(day, []);
-        }
-        tradesByDay.get(day)!.push(trade);
-      });
-
-      tradesByDay.forEach((dayTrades) => {
-        const pnl = dayTrades.reduce((sum, trade) => {
-          const value = trade.total_value - trade.commission - trade.tax;
-          return sum + (trade.side === 'sell' ? value : -value);
-        }, 0);
-        dailyReturns.push(pnl);
-      });
-
       // Calculate mean return
       const meanReturn = dailyReturns.reduce((sum, r) => sum + r, 0) / dailyReturns.length;
 
@@ -275,13 +275,14 @@ export function validateTradingHours(
   return { valid: true };
 }
 
+// Basic symbol validation for Indian stock market; compiled once, checked on every order
+const SYMBOL_REGEX = /^[A-Z0-9&-]+$/;
+
 /**
  * Validate symbol format
  */
 export function validateSymbol(symbol: string): { valid: boolean; error?: string } {
-  // Basic symbol validation for Indian stock market
-  const symbolRegex = /^[A-Z0-9&-]+$/;
-  if (!symbolRegex.test(symbol)) {
+  if (!SYMBOL_REGEX.test(symbol)) {
     return {
       valid: false,
       error: 'Invalid symbol format. Only uppercase letters, numbers, and hyphens are allowed.',
@@ -294,12 +295,13 @@ export function validateSymbol(symbol: string): { valid: boolean; error?: string
 // UTILITY VALIDATORS
 // =====================================================
 
+const UUID_REGEX = /^[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$/i;
+
 /**
  * Validate UUID format
  */
 export function validateUUID(id: string): boolean {
-  const uuidRegex = /^[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$/i;
-  return uuidRegex.test(id);
+  return UUID_REGEX.test(id);
 }
 
 /**
@@ -23,6 +23,12 @@ const twoFASchema = z.object({
 
 type TwoFAFormData = z.infer<typeof twoFASchema>;
 
+const forgotPasswordSchema = z.object({
+  email: z.string().email('Please enter a valid email address'),
+});
+
+type ForgotPasswordData = z.infer<typeof forgotPasswordSchema>;
+
 const LoginPage: React.FC = () => {
   const navigate = useNavigate();
   const { login, loginWith2FA } = useAuth();
@@ -233,12 +239,6 @@ const ForgotPasswordModal: React.FC<{ isOpen: boolean; onClose: () => void }> =
   const { addToast } = useToast();
   const [isSubmitted, setIsSubmitted] = useState(false);
 
-  const forgotPasswordSchema = z.object({
-    email: z.string().email('Please enter a valid email address'),
-  });
-
-  type ForgotPasswordData = z.infer<typeof forgotPasswordSchema>;
-
   const {
     register,
     handleSubmit,
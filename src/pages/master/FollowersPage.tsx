@@ -5,6 +5,7 @@ import Container from '../../components/layout/Container';
 import PageHeader from '../../components/layout/PageHeader';
 import { useToast } from '../../components/ui/Toast';
 import type { Column } from '../../components/ui/Table';
+import { formatINR } from '../../lib/format';
 
 interface Follower {
   id: string;
@@ -143,7 +144,7 @@ const FollowersPage: React.FC = () => {
       sortable: true,
       render: (value) => (
         <span className={`font-numbers font-semibold ${value >= 0 ? 'text-profit' : 'text-loss'}`}>
-          ₹{value.toLocaleString('en-IN', { minimumFractionDigits: 2 })}
+          {formatINR(value)}
         </span>
       ),
     },
@@ -216,7 +217,7 @@ const FollowersPage: React.FC = () => {
         />
         <StatCard
           title="Total P&L"
-          value={`₹${totalPnL.toLocaleString('en-IN', { minimumFractionDigits: 2 })}`}
+          value={formatINR(totalPnL)}
           trend={totalPnL >= 0 ? 'up' : 'down'}
         />
       </div>
@@ -4,6 +4,7 @@ import { Button, Card, CardContent, CardHeader, CardTitle, StatCard, Modal, Inpu
 import Container from '../../components/layout/Container';
 import PageHeader from '../../components/layout/PageHeader';
 import { useToast } from '../../components/ui/Toast';
+import { formatINR } from '../../lib/format';
 
 interface Strategy {
   id: string;
@@ -100,7 +101,7 @@ const StrategiesPage: React.FC = () => {
         />
         <StatCard
           title="Combined P&L"
-          value={`₹${totalPnL.toLocaleString('en-IN', { minimumFractionDigits: 2 })}`}
+          value={formatINR(totalPnL)}
           icon={BarChart3}
           iconColor={totalPnL >= 0 ? 'text-profit' : 'text-loss'}
           trend={totalPnL >= 0 ? 'up' : 'down'}
@@ -157,7 +158,7 @@ const StrategiesPage: React.FC = () => {
                       strategy.pnl >= 0 ? 'text-profit' : 'text-loss'
                     }`}
                   >
-                    ₹{strategy.pnl.toLocaleString('en-IN', { minimumFractionDigits: 2 })}
+                    {formatINR(strategy.pnl)}
                   </span>
                 </div>
               </div>
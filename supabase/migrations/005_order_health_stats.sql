@@ -0,0 +1,28 @@
+-- Order Health Statistics
+-- Migration: 005_order_health_stats
+-- Description: Server-side aggregation of order outcomes for trading system monitoring
+
+-- =====================================================
+-- MONITORING FUNCTIONS
+-- =====================================================
+
+-- Get order success/failure counts and average latency since a point in time
+-- Uses filtered aggregates so one statement replaces fetching every order row
+CREATE OR REPLACE FUNCTION get_order_health_stats(p_since TIMESTAMPTZ)
+RETURNS TABLE (
+  total_orders INTEGER,
+  successful_orders INTEGER,
+  failed_orders INTEGER,
+  avg_latency_ms DECIMAL(15, 2)
+) AS $$
+BEGIN
+  RETURN QUERY
+  SELECT
+    COUNT(*)::INTEGER as total_orders,
+    COUNT(*) FILTER (WHERE o.status IN ('filled', 'partially_filled'))::INTEGER as successful_orders,
+    COUNT(*) FILTER (WHERE o.status = 'rejected')::INTEGER as failed_orders,
+    COALESCE(AVG(EXTRACT(EPOCH FROM (o.updated_at - o.created_at)) * 1000), 0)::DECIMAL(15, 2) as avg_latency_ms
+  FROM orders o
+  WHERE o.created_at >= p_since;
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,33 @@
+-- Trade P&L Aggregates
+-- Migration: 006_trade_pnl_aggregates
+-- Description: Server-side trade P&L aggregation for the risk engine
+
+-- =====================================================
+-- RISK AGGREGATION FUNCTIONS
+-- =====================================================
+
+-- Get a user's net trade P&L, volume and trade count since a point in time
+-- Sells add (value - charges), buys subtract it, matching the risk engine's daily P&L
+CREATE OR REPLACE FUNCTION get_user_trade_pnl(
+  p_user_id UUID,
+  p_since TIMESTAMPTZ
+)
+RETURNS TABLE (
+  trade_count INTEGER,
+  total_volume DECIMAL(15, 2),
+  net_pnl DECIMAL(15, 2)
+) AS $$
+BEGIN
+  RETURN QUERY
+  SELECT
+    COUNT(*)::INTEGER as trade_count,
+    COALESCE(SUM(t.total_value), 0)::DECIMAL(15, 2) as total_volume,
+    COALESCE(SUM(
+      (t.total_value - COALESCE(t.commission, 0) - COALESCE(t.tax, 0)) *
+      (CASE WHEN t.side = 'sell' THEN 1 ELSE -1 END)
+    ), 0)::DECIMAL(15, 2) as net_pnl
+  FROM trades t
+  WHERE t.user_id = p_user_id
+    AND t.executed_at >= p_since;
+END;
+$$ LANGUAGE plpgsql;
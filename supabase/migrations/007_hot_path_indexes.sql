@@ -0,0 +1,46 @@
+-- Hot Path Indexes
+-- Migration: 007_hot_path_indexes
+-- Description: Composite and partial indexes matching the application's most frequent filters
+
+-- =====================================================
+-- ORDERS
+-- =====================================================
+
+-- User order history: WHERE user_id = ? ORDER BY created_at DESC LIMIT ?
+CREATE INDEX idx_orders_user_created ON orders(user_id, created_at DESC);
+
+-- Strategy order history: WHERE strategy_id = ? ORDER BY created_at DESC LIMIT ?
+CREATE INDEX idx_orders_strategy_created ON orders(strategy_id, created_at DESC);
+
+-- Master (non-copied) orders per user
+CREATE INDEX idx_orders_master_created ON orders(user_id, created_at DESC)
+  WHERE parent_order_id IS NULL;
+
+-- Open orders, checked before modify/cancel
+CREATE INDEX idx_orders_open ON orders(user_id, status)
+  WHERE status IN ('pending', 'submitted');
+
+-- =====================================================
+-- TRADES AND PORTFOLIOS
+-- =====================================================
+
+-- Per-user trade windows used by risk and performance analytics
+CREATE INDEX idx_trades_user_executed ON trades(user_id, executed_at DESC);
+
+-- Open positions: WHERE user_id = ? AND quantity > 0
+CREATE INDEX idx_portfolios_user_open ON portfolios(user_id)
+  WHERE quantity > 0;
+
+-- =====================================================
+-- RELATIONSHIPS
+-- =====================================================
+
+-- Active followers of a master, and masters followed by a follower
+CREATE INDEX idx_master_followers_master_active ON master_followers(master_id, follower_id)
+  WHERE status = 'active';
+CREATE INDEX idx_master_followers_follower_active ON master_followers(follower_id, master_id)
+  WHERE status = 'active';
+
+-- Active subscribers of a strategy, read on every master order copy
+CREATE INDEX idx_strategy_subscriptions_strategy_active ON strategy_subscriptions(strategy_id)
+  WHERE is_active = TRUE;
@@ -0,0 +1,94 @@
+-- Strategy Performance Aggregates
+-- Migration: 008_strategy_performance_aggregates
+-- Description: Rewrite calculate_strategy_performance without the buy x sell self-join
+
+-- =====================================================
+-- PERFORMANCE CALCULATION FUNCTIONS
+-- =====================================================
+
+-- Calculate daily strategy performance
+-- Each aggregate reads its own row set: day totals come from one pass over the
+-- day's trades, and each buy is compared against a single per-symbol sell
+-- aggregate instead of being joined to every sell row
+CREATE OR REPLACE FUNCTION calculate_strategy_performance(
+  p_strategy_id UUID,
+  p_date DATE DEFAULT CURRENT_DATE
+)
+RETURNS void AS $$
+DECLARE
+  total_trades_count INTEGER;
+  winning_count INTEGER;
+  losing_count INTEGER;
+  net_pnl DECIMAL(15, 2);
+  total_vol DECIMAL(15, 2);
+  win_percentage DECIMAL(5, 2);
+BEGIN
+  -- Count trades and total volume for the day in a single scan
+  SELECT COUNT(*), COALESCE(SUM(total_value), 0)
+  INTO total_trades_count, total_vol
+  FROM trades
+  WHERE strategy_id = p_strategy_id
+    AND DATE(executed_at) = p_date;
+
+  -- Compare each of the day's buys with the strategy's average sell price per symbol
+  WITH sells AS (
+    SELECT
+      symbol,
+      SUM(price * quantity) / NULLIF(SUM(quantity), 0) AS avg_sell_price
+    FROM trades
+    WHERE strategy_id = p_strategy_id
+      AND side = 'sell'
+    GROUP BY symbol
+  )
+  SELECT
+    COUNT(*) FILTER (WHERE (s.avg_sell_price - b.price) * b.quantity > 0),
+    COUNT(*) FILTER (WHERE (s.avg_sell_price - b.price) * b.quantity < 0)
+  INTO winning_count, losing_count
+  FROM trades b
+  JOIN sells s ON s.symbol = b.symbol
+  WHERE b.strategy_id = p_strategy_id
+    AND b.side = 'buy'
+    AND DATE(b.executed_at) = p_date;
+
+  -- Calculate total P&L
+  SELECT COALESCE(SUM(realized_pnl), 0) INTO net_pnl
+  FROM portfolios
+  WHERE strategy_id = p_strategy_id;
+
+  -- Calculate win rate
+  IF total_trades_count > 0 THEN
+    win_percentage := (winning_count::DECIMAL / total_trades_count::DECIMAL) * 100;
+  ELSE
+    win_percentage := 0;
+  END IF;
+
+  -- Insert or update performance record
+  INSERT INTO strategy_performance (
+    strategy_id,
+    date,
+    total_trades,
+    winning_trades,
+    losing_trades,
+    total_pnl,
+    total_volume,
+    win_rate
+  ) VALUES (
+    p_strategy_id,
+    p_date,
+    total_trades_count,
+    winning_count,
+    losing_count,
+    net_pnl,
+    total_vol,
+    win_percentage
+  )
+  ON CONFLICT (strategy_id, date)
+  DO UPDATE SET
+    total_trades = EXCLUDED.total_trades,
+    winning_trades = EXCLUDED.winning_trades,
+    losing_trades = EXCLUDED.losing_trades,
+    total_pnl = EXCLUDED.total_pnl,
+    total_volume = EXCLUDED.total_volume,
+    win_rate = EXCLUDED.win_rate;
+END;
+$$ LANGUAGE plpgsql;
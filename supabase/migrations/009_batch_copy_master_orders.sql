@@ -0,0 +1,59 @@
+-- Batch Copy Master Orders
+-- Migration: 009_batch_copy_master_orders
+-- Description: Copy a master order to all followers with one set-based INSERT
+
+-- =====================================================
+-- ORDER PROCESSING FUNCTIONS
+-- =====================================================
+
+-- Copy master order to followers
+-- Replaces the per-follower INSERT loop with INSERT ... SELECT
+CREATE OR REPLACE FUNCTION copy_master_order_to_followers(master_order_id UUID)
+RETURNS INTEGER AS $$
+DECLARE
+  master_order RECORD;
+  orders_created INTEGER := 0;
+BEGIN
+  -- Get master order details
+  SELECT * INTO master_order FROM orders WHERE id = master_order_id;
+
+  IF NOT FOUND THEN
+    RETURN 0;
+  END IF;
+
+  -- Create scaled orders for all active followers with copy configurations
+  INSERT INTO orders (
+    user_id,
+    strategy_id,
+    parent_order_id,
+    order_type,
+    side,
+    symbol,
+    quantity,
+    price,
+    trigger_price,
+    status
+  )
+  SELECT
+    mf.follower_id,
+    master_order.strategy_id,
+    master_order_id,
+    master_order.order_type,
+    master_order.side,
+    master_order.symbol,
+    GREATEST(1, ROUND(master_order.quantity * cc.scaling_factor)),
+    master_order.price,
+    master_order.trigger_price,
+    'pending'
+  FROM copy_configurations cc
+  JOIN master_followers mf ON mf.id = cc.master_follower_id
+  WHERE mf.master_id = master_order.user_id
+    AND cc.is_active = TRUE
+    AND mf.status = 'active'
+    AND (cc.strategy_id = master_order.strategy_id OR cc.strategy_id IS NULL);
+
+  GET DIAGNOSTICS orders_created = ROW_COUNT;
+
+  RETURN orders_created;
+END;
+$$ LANGUAGE plpgsql;
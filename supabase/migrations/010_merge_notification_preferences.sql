@@ -0,0 +1,31 @@
+-- Merge Notification Preferences
+-- Migration: 010_merge_notification_preferences
+-- Description: Apply partial notification preference updates in the database instead of overwriting the column
+
+-- =====================================================
+-- PROFILE COLUMNS
+-- =====================================================
+
+ALTER TABLE profiles ADD COLUMN IF NOT EXISTS notification_preferences JSONB DEFAULT '{}'::jsonb;
+
+-- =====================================================
+-- NOTIFICATION FUNCTIONS
+-- =====================================================
+
+-- Merge a partial set of notification preferences into the stored ones
+-- Keys not present in p_preferences keep their current values
+CREATE OR REPLACE FUNCTION merge_notification_preferences(p_user_id UUID, p_preferences JSONB)
+RETURNS JSONB AS $$
+DECLARE
+  merged JSONB;
+BEGIN
+  UPDATE profiles
+  SET
+    notification_preferences = COALESCE(notification_preferences, '{}'::jsonb) || COALESCE(p_preferences, '{}'::jsonb),
+    updated_at = NOW()
+  WHERE id = p_user_id
+  RETURNING notification_preferences INTO merged;
+
+  RETURN merged;
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,47 @@
+-- Order Activity Statistics
+-- Migration: 011_order_activity_stats
+-- Description: Server-side order activity aggregation for compliance reporting
+
+-- =====================================================
+-- REPORTING FUNCTIONS
+-- =====================================================
+
+-- Get a user's order count, volume, largest order and most traded symbols in a period
+-- Returns one row instead of every order placed in the period
+CREATE OR REPLACE FUNCTION get_user_order_activity(
+  p_user_id UUID,
+  p_start TIMESTAMPTZ,
+  p_end TIMESTAMPTZ
+)
+RETURNS TABLE (
+  total_orders INTEGER,
+  total_volume BIGINT,
+  largest_order INTEGER,
+  frequent_symbols TEXT[]
+) AS $$
+BEGIN
+  RETURN QUERY
+  WITH period_orders AS (
+    SELECT o.symbol, o.quantity
+    FROM orders o
+    WHERE o.user_id = p_user_id
+      AND o.created_at >= p_start
+      AND o.created_at <= p_end
+  )
+  SELECT
+    COUNT(*)::INTEGER as total_orders,
+    COALESCE(SUM(po.quantity), 0)::BIGINT as total_volume,
+    COALESCE(MAX(po.quantity), 0)::INTEGER as largest_order,
+    COALESCE((
+      SELECT ARRAY_AGG(s.symbol ORDER BY s.order_count DESC)
+      FROM (
+        SELECT symbol, COUNT(*) as order_count
+        FROM period_orders
+        GROUP BY symbol
+        ORDER BY order_count DESC
+        LIMIT 5
+      ) s
+    ), ARRAY[]::TEXT[]) as frequent_symbols
+  FROM period_orders po;
+END;
+$$ LANGUAGE plpgsql;
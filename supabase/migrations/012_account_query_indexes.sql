@@ -0,0 +1,24 @@
+-- Account Query Indexes
+-- Migration: 012_account_query_indexes
+-- Description: Composite and partial indexes for audit log and notification lookups
+
+-- =====================================================
+-- AUDIT LOGS
+-- =====================================================
+
+-- Per-user audit trail: WHERE user_id = ? ORDER BY created_at DESC LIMIT ?
+CREATE INDEX idx_audit_logs_user_created ON audit_logs(user_id, created_at DESC);
+
+-- Audit logs by action: WHERE action = ? ORDER BY created_at DESC LIMIT ?
+CREATE INDEX idx_audit_logs_action_created ON audit_logs(action, created_at DESC);
+
+-- =====================================================
+-- NOTIFICATIONS
+-- =====================================================
+
+-- Notification feed: WHERE user_id = ? ORDER BY created_at DESC LIMIT ?
+CREATE INDEX idx_notifications_user_created ON notifications(user_id, created_at DESC);
+
+-- Unread notifications, read by the unread feed and mark-all-as-read
+CREATE INDEX idx_notifications_user_unread ON notifications(user_id, created_at DESC)
+  WHERE is_read = FALSE;
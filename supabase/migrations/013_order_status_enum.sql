@@ -0,0 +1,57 @@
+-- Order Status Enum
+-- Migration: 013_order_status_enum
+-- Description: Store order status as a native enum instead of TEXT with a CHECK constraint
+
+-- =====================================================
+-- ORDER STATUS TYPE
+-- =====================================================
+
+CREATE TYPE order_status AS ENUM (
+  'pending',
+  'submitted',
+  'filled',
+  'partially_filled',
+  'cancelled',
+  'rejected',
+  'expired'
+);
+
+-- =====================================================
+-- CONVERT orders.status
+-- =====================================================
+
+-- Objects that reference orders.status must be dropped while the column type changes
+DROP POLICY IF EXISTS "Users can update own pending orders" ON orders;
+DROP TRIGGER IF EXISTS copy_orders_to_followers ON orders;
+DROP TRIGGER IF EXISTS validate_order_before_submit ON orders;
+DROP INDEX IF EXISTS idx_orders_open;
+
+ALTER TABLE orders DROP CONSTRAINT IF EXISTS orders_status_check;
+ALTER TABLE orders ALTER COLUMN status DROP DEFAULT;
+ALTER TABLE orders ALTER COLUMN status TYPE order_status USING status::order_status;
+ALTER TABLE orders ALTER COLUMN status SET DEFAULT 'pending';
+
+-- =====================================================
+-- RECREATE DEPENDENT OBJECTS
+-- =====================================================
+
+-- Users can update their own pending orders
+CREATE POLICY "Users can update own pending orders"
+  ON orders FOR UPDATE
+  USING (auth.uid() = user_id AND status IN ('pending', 'submitted'));
+
+CREATE TRIGGER copy_orders_to_followers
+  AFTER INSERT OR UPDATE ON orders
+  FOR EACH ROW
+  WHEN (NEW.status = 'submitted' AND NEW.parent_order_id IS NULL)
+  EXECUTE FUNCTION auto_copy_master_orders();
+
+CREATE TRIGGER validate_order_before_submit
+  BEFORE INSERT OR UPDATE ON orders
+  FOR EACH ROW
+  WHEN (NEW.status = 'submitted')
+  EXECUTE FUNCTION validate_order_submission();
+
+-- Open orders, checked before modify/cancel
+CREATE INDEX idx_orders_open ON orders(user_id, status)
+  WHERE status IN ('pending', 'submitted');
@@ -0,0 +1,37 @@
+-- Daily Trade P&L
+-- Migration: 014_daily_trade_pnl
+-- Description: Per-day trade P&L grouped in the database for risk calculations
+
+-- =====================================================
+-- RISK AGGREGATION FUNCTIONS
+-- =====================================================
+
+-- Get a user's net trade P&L per (UTC) day since a point in time
+-- One row per trading day instead of one row per trade
+CREATE OR REPLACE FUNCTION get_user_daily_trade_pnl(
+  p_user_id UUID,
+  p_since TIMESTAMPTZ
+)
+RETURNS TABLE (
+  trade_date DATE,
+  trade_count INTEGER,
+  total_volume DECIMAL(15, 2),
+  net_pnl DECIMAL(15, 2)
+) AS $$
+BEGIN
+  RETURN QUERY
+  SELECT
+    (t.executed_at AT TIME ZONE 'UTC')::DATE as trade_date,
+    COUNT(*)::INTEGER as trade_count,
+    COALESCE(SUM(t.total_value), 0)::DECIMAL(15, 2) as total_volume,
+    COALESCE(SUM(
+      (t.total_value - COALESCE(t.commission, 0) - COALESCE(t.tax, 0)) *
+      (CASE WHEN t.side = 'sell' THEN 1 ELSE -1 END)
+    ), 0)::DECIMAL(15, 2) as net_pnl
+  FROM trades t
+  WHERE t.user_id = p_user_id
+    AND t.executed_at >= p_since
+  GROUP BY 1
+  ORDER BY 1;
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,35 @@
+-- Portfolio Price Batch
+-- Migration: 015_apply_portfolio_prices
+-- Description: Mark a user's open positions to market in one statement instead of one update per position
+
+-- =====================================================
+-- PORTFOLIO FUNCTIONS
+-- =====================================================
+
+-- Apply a batch of last traded prices to a user's open positions
+-- p_prices maps symbol -> price; positions without a price are left untouched
+-- Returns the unrealized P&L summed over the positions that were repriced
+CREATE OR REPLACE FUNCTION apply_portfolio_prices(
+  p_user_id UUID,
+  p_prices JSONB
+)
+RETURNS DECIMAL(15, 2) AS $$
+DECLARE
+  total_unrealized DECIMAL(15, 2);
+BEGIN
+  WITH repriced AS (
+    UPDATE portfolios p
+    SET
+      current_price = (p_prices ->> p.symbol)::DECIMAL,
+      unrealized_pnl = ((p_prices ->> p.symbol)::DECIMAL - p.average_price) * p.quantity,
+      last_updated_at = NOW()
+    WHERE p.user_id = p_user_id
+      AND p.quantity > 0
+      AND p_prices ? p.symbol
+    RETURNING p.unrealized_pnl
+  )
+  SELECT COALESCE(SUM(unrealized_pnl), 0) INTO total_unrealized FROM repriced;
+
+  RETURN total_unrealized;
+END;
+$$ LANGUAGE plpgsql;